@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+import csv
 import json
 import textwrap
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import Counter
+from functools import cache
 from pathlib import Path
 
 import reconcile.pylib.darwin_core as dwc
+from reconcile.pylib.census import census
+from reconcile.pylib.compare import HashCache, same_files
+from reconcile.pylib.labels.accession_number import AccessionNumber
 from reconcile.pylib.labels.admin_unit import AdminUnit
-from reconcile.pylib.labels.id_number import IdNumber
 from reconcile.pylib.labels.job import Job
 from reconcile.pylib.labels.locality import Locality
 from reconcile.pylib.labels.record_number import RecordNumber
+from reconcile.pylib.labels.recorded_by_id import RecordedById
 from reconcile.pylib.labels.sex import Sex
 from reconcile.pylib.labels.taxon_assoc import TaxonAssociation
 from reconcile.pylib.labels.taxon_auth import TaxonAuthority
 from reconcile.pylib.labels.taxon_name import TaxonName
 from reconcile.pylib.labels.taxon_rank import TaxonRank
+from reconcile.pylib.sources import open_source
 from reconcile.pylib.traiter.coordinate_precision import CoordinatePrecision
 from reconcile.pylib.traiter.coordinate_uncertainty import CoordinateUncertainty
 from reconcile.pylib.traiter.decimal_latitude import DecimalLatitude
@@ -34,78 +39,73 @@ from reconcile.pylib.util import clean_key
 CHOICES = ["count-bad-json", "count-label-problems"]
 
 
-@dataclass
-class Terms:
-    path: Path
-    missing_file: bool = False
-    bad_json: bool = False
-    all_terms: list[str] = field(default_factory=list)
-    bad_terms: list[str] = field(default_factory=list)
-    fixed_terms: list[str] = field(default_factory=list)
-
-
 def main():
     args = parse_args()
 
     match args.utility:
         case "count-bad-json":
-            count_bad_json(args.llm_dir, args.clean_dir)
+            count_bad_json(
+                args.llm_dir,
+                args.clean_dir,
+                args.workers,
+                args.hash_manifest,
+                args.report,
+            )
         case "count-label-problems":
-            count_label_problems(args.llm_dir, args.clean_dir)
-
-
-def count_label_problems(llm_dir, clean_dir):
-    all_terms = defaultdict(Terms)
-    for path in llm_dir.glob("*.json"):
-        all_terms[path.stem] = Terms(path=path)
-
-    clean_paths = {f.stem: f for f in clean_dir.glob("*.json")}
-
-    for stem, terms in all_terms.items():
-        if stem not in clean_paths:
-            terms.missing_file = True
-            continue
-
-        clean_path = clean_paths[stem]
-        with terms.path.open() as llm, clean_path.open() as clean:
-            llm_text = llm.read()
-            clean_text = clean.read()
-            if llm_text != clean_text:
-                terms.bad_json = True
-
-        fixable_terms = fixable()
-
-        clean_json = json.loads(clean_text)
-        for key in clean_json:
-            key = clean_key(key)
-            terms.all_terms.append(key)
-            if key not in dwc.CORE:
-                terms.bad_terms.append(key)
-                if key in fixable_terms:
-                    terms.fixed_terms.append(key)
-
-    missing_file, bad_json, bad_terms, fixed_terms, both = 0, 0, 0, 0, 0
-    term_count, bad_count, fixed_count = 0, 0, 0
-    for terms in all_terms.values():
-        missing_file += 1 if terms.missing_file else 0
-        bad_json += 1 if terms.bad_json else 0
-        bad_terms += 1 if terms.bad_terms else 0
-        fixed_terms += 1 if terms.fixed_terms else 0
-        both += 1 if terms.bad_json and terms.bad_terms else 0
-        term_count += len(terms.all_terms)
-        bad_count += len(terms.bad_terms)
-        fixed_count += len(terms.fixed_terms)
-
-    print(f"total labels {len(all_terms)}")
-    print(f"missing json files {missing_file}")
-    print(f"bad json files {bad_json}")
-    print(f"labels with bad terms {bad_terms}")
-    print(f"labels with both bad json and bad term {both}")
-    print(f"all terms {term_count}")
-    print(f"bad terms {bad_count}")
-    print(f"fixed terms {fixed_count}")
+            count_label_problems(args.llm_dir, args.clean_dir, args.workers, args.stems)
+
+
+def count_label_problems(llm_dir, clean_dir, workers=1, stems_csv=None):
+    llm_stems = stems_in(llm_dir)
+    if stems_csv:
+        llm_stems &= read_report(stems_csv)
+    clean_stems = stems_in(clean_dir)
+    stems = sorted(llm_stems & clean_stems)
+
+    paths = [(llm_dir, ".json"), (clean_dir, ".json")]
+    counts = census(scan_label_problems, stems, paths, workers)
+
+    print(f"total labels {len(llm_stems)}")
+    print(f"missing json files {len(llm_stems - clean_stems)}")
+    print(f"bad json files {counts['bad_json']}")
+    print(f"labels with bad terms {counts['bad_terms']}")
+    print(f"labels with both bad json and bad term {counts['both']}")
+    print(f"all terms {counts['term_count']}")
+    print(f"bad terms {counts['bad_count']}")
+    print(f"fixed terms {counts['fixed_count']}")
+
+
+def scan_label_problems(stems: list[str], sources: list) -> Counter:
+    llm, clean = sources
+    fixable_terms = fixable()
+    counts = Counter()
+
+    for stem in stems:
+        clean_text = clean.read(stem)
+        bad_json = llm.read(stem) != clean_text
 
+        all_terms = [clean_key(k) for k in json.loads(clean_text)]
+        bad_terms = [k for k in all_terms if k not in dwc.CORE]
+        fixed_terms = [k for k in bad_terms if k in fixable_terms]
 
+        counts["bad_json"] += bad_json
+        counts["bad_terms"] += bool(bad_terms)
+        counts["both"] += bad_json and bool(bad_terms)
+        counts["term_count"] += len(all_terms)
+        counts["bad_count"] += len(bad_terms)
+        counts["fixed_count"] += len(fixed_terms)
+
+    return counts
+
+
+def stems_in(path) -> set[str]:
+    source = open_source(path, ".json")
+    stems = source.stems()
+    source.close()
+    return stems
+
+
+@cache
 def fixable() -> set[str]:  # noqa: PLR0915
     fix = set()
 
@@ -120,10 +120,10 @@ def fixable() -> set[str]:  # noqa: PLR0915
     fix.remove(AdminUnit.co_lb)
     fix.remove(AdminUnit.muni_lb)
 
-    fix |= set(IdNumber.acc_match)
-    fix |= set(IdNumber.id_match)
-    fix.remove(IdNumber.acc_lb)
-    fix.remove(IdNumber.id_lb)
+    fix |= set(AccessionNumber.aliases)
+    fix |= set(RecordedById.aliases)
+    fix.remove(AccessionNumber.label)
+    fix.remove(RecordedById.label)
 
     fix |= set(Job.rec_match)
     fix |= set(Job.id_match)
@@ -196,31 +196,38 @@ def fixable() -> set[str]:  # noqa: PLR0915
     return fix
 
 
-def count_bad_json(llm_dir, clean_dir):
+def count_bad_json(llm_dir, clean_dir, workers=1, hash_manifest=None, report=None):
     llm_json = {f.stem: f for f in llm_dir.glob("*.json")}
     clean_json = {f.stem: f for f in clean_dir.glob("*.json")}
 
-    missing = 0
-    same = 0
-    differ = 0
+    stems = [s for s in llm_json if s in clean_json]
+    pairs = [(llm_json[s], clean_json[s]) for s in stems]
+    with HashCache(hash_manifest) as hashes:
+        same_json = same_files(pairs, hashes, workers)
 
-    for llm_stem, llm_path in llm_json.items():
-        if llm_stem not in clean_json:
-            missing += 1
-            continue
-
-        clean_path = clean_json[llm_stem]
-        with llm_path.open() as llm, clean_path.open() as clean:
-            llm_text = llm.read()
-            clean_text = clean.read()
-            if llm_text == clean_text:
-                same += 1
-            else:
-                differ += 1
+    missing = len(llm_json) - len(stems)
+    same = sum(same_json)
+    differ = len(stems) - same
 
     total = missing + same + differ
     print(f"{missing=} {same=} {differ=} {total=}")
 
+    if report:
+        with report.open("w") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stem", "status"])
+            for stem in sorted(llm_json):
+                if stem not in clean_json:
+                    writer.writerow([stem, "missing"])
+            for stem, is_same in sorted(zip(stems, same_json, strict=True)):
+                if not is_same:
+                    writer.writerow([stem, "differ"])
+
+
+def read_report(path) -> set[str]:
+    with path.open() as f:
+        return {row["stem"] for row in csv.DictReader(f)}
+
 
 def parse_args():
     arg_parser = argparse.ArgumentParser(
@@ -233,6 +240,8 @@ def parse_args():
 
             - count-bad-json: Count how many LLM JSON files were edited to make them
               usable.
+            - count-label-problems: Count the labels with edited JSON files or keys
+              that are not Darwin Core terms.
             """
         ),
     )
@@ -257,6 +266,40 @@ def parse_args():
         help="""Contains cleaned LLM output in JSON format.""",
     )
 
+    arg_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        metavar="INT",
+        help="""Scan files in this many processes, or threads for count-bad-json.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--hash-manifest",
+        type=Path,
+        metavar="PATH",
+        help="""Keep the hashes of the files count-bad-json compares in this JSON
+            file. Files that have not changed since are not read again.""",
+    )
+
+    arg_parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="PATH",
+        help="""Write a CSV of the stems count-bad-json found missing or different
+            to this file.""",
+    )
+
+    arg_parser.add_argument(
+        "--stems",
+        type=Path,
+        metavar="PATH",
+        help="""Only look at the stems in this CSV file, like the one written by
+            count-bad-json --report.""",
+    )
+
     args = arg_parser.parse_args()
     return args
 
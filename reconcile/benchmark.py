@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import random
+import re
+import textwrap
+import time
+import tracemalloc
+from calendar import IllegalMonthError
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from dateutil import parser
+
+from reconcile.pylib import darwin_core as dwc
+from reconcile.pylib import dates
+from reconcile.pylib.labels import taxon_assoc as taxon_assoc_module
+from reconcile.pylib.labels.taxon_assoc import TaxonAssociation
+from reconcile.pylib.text_context import TextContext
+from reconcile.pylib.util import clean_key
+from reconcile.reconcile_traits import Row
+
+CHOICES = [
+    "event-date",
+    "row-memory",
+    "taxon-assoc",
+]
+
+ASSOCIATES = [100, 300, 1000]
+
+
+@dataclass
+class PlainRow:
+    """How a Row was held before it had slots and interned keys."""
+
+    stem: str
+    text: str = ""
+    traiter: dict[str, Any] = field(default_factory=dict)
+    openai: dict[str, Any] = field(default_factory=dict)
+    reconciled: dict[str, Any] = field(default_factory=dict)
+    missed: set[str] = field(default_factory=set)
+    errors: list[str] = field(default_factory=list)
+
+
+def main():
+    args = parse_args()
+
+    rng = random.Random(args.seed)  # noqa: S311
+
+    match args.benchmark:
+        case "event-date":
+            event_date(rng, args.rows)
+        case "row-memory":
+            row_memory(rng, args.rows)
+        case "taxon-assoc":
+            taxon_assoc(rng, args.rows)
+
+
+def event_date(rng: random.Random, rows: int) -> None:
+    """Compare the date parser in EventDate with calling dateutil every time."""
+    strings = date_strings(rng, rows)
+
+    def dateutil_parse(value):
+        try:
+            return parser.parse(value).date()
+        except (parser.ParserError, IllegalMonthError):
+            return None
+
+    dates.cached_parse.cache_clear()
+
+    old, old_secs = timed(dateutil_parse, strings)
+    new, new_secs = timed(dates.cached_parse, strings)
+
+    if old != new:
+        msg = "The date parsers disagree"
+        raise ValueError(msg)
+
+    report("dateutil", old_secs, rows)
+    report("parse_date", new_secs, rows)
+    print(f"speedup {old_secs / new_secs:.1f}x")
+
+
+def row_memory(rng: random.Random, rows: int) -> None:
+    """Measure the memory each row holds with plain and slotted rows."""
+    records = label_records(rng, rows)
+
+    def plain_row(stem, traiter, openai):
+        row = PlainRow(stem=stem)
+        row.traiter = json.loads(traiter)
+        new = {}
+        for key, value in json.loads(openai).items():
+            new[key] = value
+            if isinstance(value, dict):
+                new |= dict(value.items())
+        # The old clean_key built a new string for every key
+        row.openai = {(clean_key(k) + " ")[:-1]: v for k, v in new.items()}
+        row.missed = set(row.openai)
+        return row
+
+    def slotted_row(stem, traiter, openai):
+        row = Row(stem=stem)
+        row.get_traiter(SimpleNamespace(read=lambda _: traiter))
+        row.get_openai(SimpleNamespace(read=lambda _: openai))
+        row.missed = tuple(row.openai)
+        return row
+
+    slotted_row(*records[0])  # Fill the key cache before measuring
+
+    old = measured(plain_row, records)
+    new = measured(slotted_row, records)
+
+    print(f"{'plain rows':<14} {old / rows:8.0f} bytes/row")
+    print(f"{'slotted rows':<14} {new / rows:8.0f} bytes/row")
+    print(f"saved {100.0 * (old - new) / old:.1f}%")
+
+
+def taxon_assoc(rng: random.Random, rows: int) -> None:
+    """Compare merging long associated taxa lists by substring with the set index."""
+
+    def substring_merge(traiter, other):
+        t_val = traiter[TaxonAssociation.label]
+        t_vals = [v for v in t_val.split(dwc.SEP) if v]
+        t_val = t_val.casefold()
+        o_vals = re.split(r"\s*[,;|]\s*", other["dwc:associatedSpecies"])
+        t_vals += [v for v in o_vals if v and v.casefold() not in t_val]
+        return {TaxonAssociation.label: dwc.SEP.join(t_vals)}
+
+    def set_merge(traiter, other):
+        return TaxonAssociation.reconcile(traiter, other, TextContext())
+
+    def kept(results):
+        return sum(dwc.field_len(r[TaxonAssociation.label]) for r in results)
+
+    merges = {
+        "substring": lambda pair: substring_merge(*pair),
+        "set index": lambda pair: set_merge(*pair),
+    }
+
+    for size in ASSOCIATES:
+        labels = associate_lists(rng, rows, size)
+
+        # Run each merge twice from empty caches, alternating which goes first
+        results, secs = {}, dict.fromkeys(merges, float("inf"))
+        for order in (list(merges), list(reversed(merges))):
+            for name in order:
+                taxon_assoc_module.associate_key.cache_clear()
+                taxon_assoc_module.word_runs.cache_clear()
+                results[name], elapsed = timed(merges[name], labels)
+                secs[name] = min(secs[name], elapsed)
+
+        old, new = results["substring"], results["set index"]
+        print(
+            f"{size} associates, kept {kept(old) / rows:.0f} vs. {kept(new) / rows:.0f}"
+        )
+        report("substring", secs["substring"], rows)
+        report("set index", secs["set index"], rows)
+        print(f"speedup {secs['substring'] / secs['set index']:.1f}x")
+
+
+def associate_lists(
+    rng: random.Random, rows: int, size: int
+) -> list[tuple[dict, dict]]:
+    """Mimic survey labels with long lists of associates, some of them repeated."""
+    genera = [f"Genus{i}" for i in range(200)]
+    species = [f"species{i}" for i in range(50)]
+    labels = []
+    for _ in range(rows):
+        names = [f"{rng.choice(genera)} {rng.choice(species)}" for _ in range(size)]
+        traiter = {TaxonAssociation.label: dwc.SEP.join(names[: size // 2])}
+        names = names[size // 3 :] + [n.lower() for n in rng.sample(names, size // 6)]
+        names += [n.split()[0] for n in rng.sample(names, size // 6)]
+        other = {"dwc:associatedSpecies": ", ".join(names)}
+        labels.append((traiter, other))
+    return labels
+
+
+def label_records(rng: random.Random, rows: int) -> list[tuple[str, str, str]]:
+    """Build traiter and OpenAI JSON like we get for each label."""
+    terms = sorted(dwc.CORE)
+    words = ["Quercus", "alba", "Texas", "Travis", "near", "river", "oak", "1972"]
+
+    def value():
+        return " ".join(rng.choices(words, k=rng.randint(1, 6)))
+
+    records = []
+    for i in range(rows):
+        traiter = {k: value() for k in rng.sample(terms, 12)}
+        openai = {k: value() for k in rng.sample(terms, 16)}
+        openai["dwc:eventDate"] = {"year": "1972", "month": "4", "day": "1"}
+        records.append((f"label_{i:07d}", json.dumps(traiter), json.dumps(openai)))
+    return records
+
+
+def measured(build, records) -> int:
+    tracemalloc.start()
+    kept = [build(*r) for r in records]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def date_strings(rng: random.Random, rows: int) -> list[str]:
+    """Mimic the dates we see: mostly ISO, some from OpenAI dicts, some verbatim."""
+    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun"]
+    months += ["Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    shapes = ["iso", "dict", "verbatim", "bad"]
+
+    strings = []
+    for shape in rng.choices(shapes, weights=[70, 20, 8, 2], k=rows):
+        year = rng.randint(1850, 2023)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 31)
+        match shape:
+            case "iso":
+                strings.append(f"{year}-{month:02d}-{day:02d}")
+            case "dict":
+                strings.append(f"{year}-{month}-{day}")
+            case "verbatim":
+                strings.append(f"{day} {months[month - 1]} {year}")
+            case "bad":
+                strings.append(f"{day}-{month}-{year}x")
+    return strings
+
+
+def timed(func, strings):
+    start = time.perf_counter()
+    results = [func(s) for s in strings]
+    return results, time.perf_counter() - start
+
+
+def report(name: str, secs: float, rows: int) -> None:
+    print(f"{name:<12} {secs:8.3f} s {1e6 * secs / rows:8.2f} µs/row")
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        fromfile_prefix_chars="@",
+        description=textwrap.dedent(
+            """
+            Benchmark the faster reconciler paths against the code they replace
+            using synthetic data.
+
+            - event-date: Parse dates with dateutil vs. the cached fast path.
+            - row-memory: Memory held by each row with plain vs. slotted rows.
+            - taxon-assoc: Merging long associated taxa lists with substring
+              searches vs. a set of word runs.
+            """
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--benchmark",
+        choices=CHOICES,
+        default=CHOICES[0],
+    )
+
+    arg_parser.add_argument(
+        "--rows",
+        metavar="INT",
+        type=int,
+        default=100_000,
+        help="""How many synthetic rows to use. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--seed",
+        metavar="INT",
+        type=int,
+        default=4438,
+        help="""Random number seed.""",
+    )
+
+    args = arg_parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    main()
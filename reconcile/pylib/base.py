@@ -1,25 +1,155 @@
+import hashlib
+import sys
+from collections import defaultdict
 from collections.abc import Callable
+from itertools import chain
 from pathlib import Path
 from typing import Any, ClassVar
 
-from . import util
+from . import darwin_core, util
+from .text_context import TextContext
 
 
 class Template:
     def __init__(self, *actions):
+        self._classes = list(actions)
         self._actions = [a.reconcile for a in actions]
+        self.stats = None  # Set to a Stats object to time the actions
+        self.resolver = None  # Set to a KeyResolver to rename near miss keys
+        self.build()
 
     @property
     def actions(self) -> list[Callable]:
         return self._actions
 
     def append(self, action):
+        self._classes.append(action)
         self._actions.append(action.reconcile)
+        self.build()
+
+    def build(self) -> None:
+        self.index = AliasIndex(self._classes)
+
+        # Map each input key to the actions that read it
+        self.always = []
+        self.dispatch = defaultdict(list)
+        for i, cls in enumerate(self._classes):
+            if cls.traiter_keys is None:
+                self.always.append(i)
+                continue
+            keys = {k for aliases in cls.alias_lists for k in aliases}
+            keys |= set(cls.traiter_keys)
+            for key in keys:
+                self.dispatch[key].append(i)
+
+    def known_keys(self) -> set[str]:
+        """Get every Darwin Core term and alias an action will look for."""
+        return set(darwin_core.CORE) | set(self.index.routes)
+
+    def resolve(self, other: dict[str, Any]) -> dict[str, Any]:
+        return self.resolver.resolve_keys(other) if self.resolver else other
+
+    def route(self, other: dict[str, Any]) -> "Routed":
+        return self.index.route(other)
+
+    def select(self, traiter: dict[str, Any], other: dict[str, Any]) -> list[Callable]:
+        """Get the actions, in order, that have an input key in this row."""
+        chosen = set(self.always)
+        for key in chain(traiter, other):
+            if found := self.dispatch.get(key):
+                chosen.update(found)
+        return [self._actions[i] for i in sorted(chosen)]
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash the action order and the code behind it to version the output."""
+        hasher = hashlib.sha256()
+
+        for cls in self._classes:
+            hasher.update(f"{cls.__module__}.{cls.__qualname__}\n".encode())
+
+        # The actions lean on helpers all over pylib, so hash every file in it
+        pylib = Path(__file__).parent
+        paths = {Path(sys.modules[c.__module__].__file__) for c in self._classes}
+        paths |= set(pylib.rglob("*.py")) | set(pylib.rglob("*.csv"))
+
+        if self.resolver:  # Renamed keys change what the actions see
+            hasher.update(f"{self.resolver.threshold}\n".encode())
+            paths.add(Path(sys.modules[type(self.resolver).__module__].__file__))
+
+        for path in sorted(paths):
+            hasher.update(path.read_bytes())
+
+        return hasher.hexdigest()
+
+
+class Routed(dict):
+    """An OpenAI dict that knows which of its keys each alias list would find."""
+
+    def __init__(
+        self, other: dict[str, Any], hits: dict[int, Any], index: "AliasIndex"
+    ):
+        super().__init__(other)
+        self.hits = hits
+        self.index = index
+
+    def folded_keys(self) -> list[tuple[str, str]]:
+        return [(self.index.fold(k), k) for k in self]
+
+
+class AliasIndex:
+    """
+    Compile the alias lists of all actions into one lookup table.
+
+    Each key maps to the alias lists that contain it and its position in them.
+    Routing an OpenAI dict is then one pass over its keys, keeping the truthy
+    value with the lowest position for each list. That is what Base.search finds
+    when it walks the same list, so first alias still wins.
+    """
+
+    def __init__(self, actions):
+        self.compiled: set[int] = set()
+        self.routes: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self.folded: dict[str, str] = {}
+
+        for action in actions:
+            for aliases in action.alias_lists:
+                if id(aliases) in self.compiled:
+                    continue
+                self.compiled.add(id(aliases))
+                for priority, alias in enumerate(aliases):
+                    self.routes[alias].append((id(aliases), priority))
+
+    def route(self, other: dict[str, Any]) -> Routed:
+        best = {}
+        for key, value in other.items():
+            if not value:
+                continue
+            for list_id, priority in self.routes.get(key, ()):
+                if list_id not in best or priority < best[list_id][0]:
+                    best[list_id] = (priority, value)
+        hits = {list_id: value for list_id, (_, value) in best.items()}
+        return Routed(other, hits, self)
+
+    def fold(self, key: str) -> str:
+        if (folded := self.folded.get(key)) is None:
+            folded = self.folded[key] = key.casefold()
+        return folded
 
 
 class Base:
     nil: ClassVar[list[str]] = "null none not provided not specified".split()
 
+    # The alias lists that the action searches for in the top level OpenAI dict
+    alias_lists: ClassVar[list[list[str]]] = []
+
+    # The traiter keys the action reads. An action only runs when the row has one
+    # of these keys or a key in its alias lists. None means always run it
+    traiter_keys: ClassVar[list[str] | None] = None
+
+    # Does the action look at the OCR text? If not the text file is never read
+    needs_text: ClassVar[bool] = True
+
     unit_csv: ClassVar[Path] = Path(__file__).parent / "unit_length_terms.csv"
     tic_csv: ClassVar[Path] = Path(__file__).parent / "unit_tic_terms.csv"
     factors_cm: ClassVar[list[float]] = util.term_data(
@@ -29,12 +159,19 @@ class Base:
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, str]:
         raise NotImplementedError
 
     @classmethod
     def search(cls, other: dict[str, Any], aliases: list[str], default: Any = ""):
+        if isinstance(other, Routed) and id(aliases) in other.index.compiled:
+            if value := other.hits.get(id(aliases)):
+                if isinstance(value, str) and value.lower() in cls.nil:
+                    return default
+                return value
+            return default
+
         for alias in aliases:
             if value := other.get(alias):
                 if isinstance(value, str) and value.lower() in cls.nil:
@@ -45,8 +182,11 @@ class Base:
     @classmethod
     def wildcard(cls, other, pattern: str, default=""):
         pattern = pattern.casefold()
-        for key in other:
-            folded = key.casefold()
+        if isinstance(other, Routed):
+            keys = other.folded_keys()
+        else:
+            keys = [(k.casefold(), k) for k in other]
+        for folded, key in keys:
             if folded in cls.nil:
                 return default
             if folded.find(pattern) > -1:
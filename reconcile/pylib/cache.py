@@ -0,0 +1,120 @@
+"""
+Cache reconciled results keyed on the inputs of a label.
+
+The cache is a SQLite file that maps a hash of the OCR text, traiter output,
+OpenAI output, and template fingerprint to the reconciled fields and errors. It
+is emptied whenever the template fingerprint changes. Once it holds more than
+max_size results the least recently used ones are evicted.
+
+Reads never write. New results and the times cached ones were used are held in
+memory and written together in one short transaction, so processes sharing the
+cache only wait on each other for the length of that write.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+FLUSH_EVERY = 100  # Puts
+EVICT_EVERY = 10_000  # Puts
+
+
+class ResultCache:
+    def __init__(self, path: Path, fingerprint: str, max_size: int):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_size = max_size
+        self.unevicted = 0  # Results written since the last eviction
+        self.pending = {}  # Results that are not written yet
+        self.used = {}  # When cached results were used, not written yet
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS results (
+                key BLOB PRIMARY KEY, result TEXT, used INTEGER);
+            CREATE INDEX IF NOT EXISTS results_used ON results (used);
+            """
+        )
+
+        row = self.db.execute(
+            "SELECT value FROM meta WHERE name = 'fingerprint'"
+        ).fetchone()
+        if not row or row[0] != fingerprint:
+            self.clear()
+
+    def key(self, text: str, traiter: dict, openai: dict) -> bytes:
+        data = json.dumps([self.fingerprint, text, traiter, openai], sort_keys=True)
+        return hashlib.sha256(data.encode()).digest()
+
+    def get(self, key: bytes) -> tuple[dict[str, Any], list[str]] | None:
+        if pending := self.pending.get(key):
+            result = pending[0]
+        else:
+            row = self.db.execute(
+                "SELECT result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            result = row[0]
+            self.used[key] = time.time_ns()
+        reconciled, errors = json.loads(result)
+        return reconciled, errors
+
+    def put(self, key: bytes, reconciled: dict[str, Any], errors: list[str]) -> None:
+        self.pending[key] = (json.dumps([reconciled, errors]), time.time_ns())
+        if len(self.pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the new results and use times in one transaction."""
+        if not self.pending and not self.used:
+            return
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO results (key, result, used) VALUES (?, ?, ?)",
+                [(k, result, used) for k, (result, used) in self.pending.items()],
+            )
+            self.db.executemany(
+                "UPDATE results SET used = ? WHERE key = ?",
+                [(used, k) for k, used in self.used.items()],
+            )
+            self.unevicted += len(self.pending)
+            if self.unevicted >= EVICT_EVERY:
+                self.evict()
+        self.pending.clear()
+        self.used.clear()
+
+    def evict(self) -> None:
+        (count,) = self.db.execute("SELECT COUNT(*) FROM results").fetchone()
+        if count > self.max_size:
+            self.db.execute(
+                """DELETE FROM results WHERE key IN (
+                    SELECT key FROM results ORDER BY used LIMIT ?)""",
+                (count - self.max_size,),
+            )
+        self.unevicted = 0
+
+    def clear(self) -> None:
+        self.db.execute("DELETE FROM results")
+        self.db.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES ('fingerprint', ?)",
+            (self.fingerprint,),
+        )
+        self.db.commit()
+
+    def commit(self) -> None:
+        self.flush()
+
+    def close(self) -> None:
+        self.flush()
+        with self.db:
+            self.evict()
+        self.db.close()
@@ -0,0 +1,77 @@
+"""
+Count keys and problems across a corpus of JSON files in parallel.
+
+A scan function turns a chunk of stems into a Counter. Chunks are scanned in
+worker processes that each open the sources once, and their counters are added
+together as they finish.
+"""
+
+import json
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from reconcile.pylib import darwin_core as dwc
+from reconcile.pylib.sources import open_source
+from reconcile.pylib.util import clean_key
+
+CHUNK_SIZE = 500
+
+Scan = Callable[[list[str], list], Counter]
+
+_worker_sources: list | None = None
+
+
+def census(
+    scan: Scan, stems: list[str], paths: list[tuple[Path, str]], workers: int = 1
+) -> Counter:
+    """Run scan(stems, sources) over chunks of stems and add up the counters."""
+    if workers <= 1:
+        sources = [open_source(path, suffix) for path, suffix in paths]
+        try:
+            return scan(stems, sources)
+        finally:
+            for source in sources:
+                source.close()
+
+    chunks = [stems[i : i + CHUNK_SIZE] for i in range(0, len(stems), CHUNK_SIZE)]
+    total = Counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(paths,)
+    ) as executor:
+        for counts in executor.map(partial(scan_chunk, scan), chunks):
+            total.update(counts)
+    return total
+
+
+def init_worker(paths: list[tuple[Path, str]]) -> None:
+    global _worker_sources
+    _worker_sources = [open_source(path, suffix) for path, suffix in paths]
+
+
+def scan_chunk(scan: Scan, stems: list[str]) -> Counter:
+    return scan(stems, _worker_sources)
+
+
+def scan_keys(stems: list[str], sources: list) -> Counter:
+    """Count how many files each cleaned key is in."""
+    (source,) = sources
+    keys = Counter()
+    for stem in stems:
+        for key in json.loads(source.read(stem)):
+            keys[clean_key(key)] += 1
+    return keys
+
+
+def key_report(keys: Counter) -> None:
+    valid_count = 0
+    print("key,valid,count")
+    for key, count in sorted(keys.items()):
+        valid = 1 if key in dwc.CORE else ""
+        print(f"{key},{valid},{count}")
+        valid_count += 1 if valid else 0
+
+    print(f"{valid_count}/{len(keys)} valid keys")
+    print(f"{len(keys) - valid_count}/{len(keys)} invalid keys")
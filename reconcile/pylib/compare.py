@@ -0,0 +1,86 @@
+"""
+Compare pairs of files by a hash of their contents.
+
+Files are hashed on a thread pool, hashlib lets go of the GIL while it works.
+A text mode read treats CRLF and LF line ends alike, so a file with a carriage
+return also gets a digest of its bytes with the line ends made LF. Digests can
+be kept in a JSON hash manifest keyed on each file's size and modification time,
+so files that have not changed are not read again on the next audit.
+"""
+
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ENTRY_LEN = 4  # Size, modification time, digest, and text digest
+
+
+class HashCache:
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self.hashes: dict[str, list] = {}
+        self.changed = False
+        self.lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            with self.path.open() as f:
+                self.hashes = json.load(f)
+
+    def digests(self, path: Path) -> tuple[str, str | None]:
+        """Get the digest of a file and, if it has a carriage return, of its text."""
+        key = str(path)
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        entry = self.hashes.get(key)
+        if entry and len(entry) == ENTRY_LEN and entry[:2] == signature:
+            return entry[2], entry[3]
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        text = hashlib.sha256(newlines(data)).hexdigest() if b"\r" in data else None
+
+        with self.lock:
+            self.hashes[key] = [*signature, digest, text]
+            self.changed = True
+        return digest, text
+
+    def save(self) -> None:
+        if not self.path or not self.changed:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with temp.open("w") as f:
+            json.dump(self.hashes, f)
+        temp.replace(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.save()
+
+
+def same_file(path1: Path, path2: Path, hashes: HashCache) -> bool:
+    digest1, text1 = hashes.digests(path1)
+    digest2, text2 = hashes.digests(path2)
+    if digest1 == digest2:
+        return True
+    if text1 is None and text2 is None:
+        return False
+    # Without a carriage return a file's text is its bytes
+    return (text1 or digest1) == (text2 or digest2)
+
+
+def newlines(data: bytes) -> bytes:
+    """Make the line ends LF. No byte of a multibyte UTF-8 character is a CR or LF."""
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def same_files(
+    pairs: list[tuple[Path, Path]], hashes: HashCache, workers: int = 1
+) -> list[bool]:
+    """Check if each pair of files holds the same text. Results are in order."""
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        return list(executor.map(lambda p: same_file(*p, hashes), pairs))
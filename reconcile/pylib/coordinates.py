@@ -0,0 +1,135 @@
+"""
+Pull latitudes and longitudes out of strings like 30°16'15"N or 30 16.25 N.
+
+Decimal degrees, degrees minutes seconds, and degrees decimal minutes are all read
+by one precompiled pattern, with a sign or a hemisphere letter or word before or
+after. Degrees, minutes, and seconds may be marked with symbols, words like "deg"
+and "min", the letters d, m, and s, or colons. Only the parts are parsed here,
+turning them into decimal degrees and checking their ranges is left to the
+caller. Parses are cached because the same strings turn up on many labels.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Any
+
+CACHE_SIZE = 100_000
+
+LAT, LON = 0, 1
+
+HEMISPHERES = {"n": "N", "north": "N", "s": "S", "south": "S"}
+HEMISPHERES |= {"e": "E", "east": "E", "w": "W", "west": "W"}
+
+HEMISPHERE = r"north|south|east|west|[nsew]"
+
+# The d, m, and s letters are lowercase so an uppercase S is a hemisphere
+DEGREE = r"[°º˚]|deg(?:ree)?s?\b\.?|(?-i:d)(?![a-z])"
+MINUTE = r"['′’]|min(?:ute)?s?\b\.?|(?-i:m)(?![a-z])"
+SECOND = r"""["″”]|''|′′|’’|sec(?:ond)?s?\b\.?|(?-i:s)(?![a-z])"""
+
+EDGES = " \t\r\n.,;()[]{}"  # Punctuation that may wrap a whole coordinate
+
+COORDINATE = re.compile(
+    rf"""
+    (?:(?<![a-z])(?P<before>{HEMISPHERE})\.?\s*)?
+    (?P<sign>[-+−])?\s*
+    (?<![\d.])
+    (?:
+        (?P<decimal>\d{{1,3}}\.\d+)(?!\d)\s*(?P<symbol1>{DEGREE})?
+      | (?P<degrees>\d{{1,3}})(?![\d.])\s*(?P<symbol2>{DEGREE}|:)?\s*
+        (?:
+            (?P<minutes>\d{{1,2}}(?:\.\d+)?)(?![\d.])\s*(?:{MINUTE}|:)?\s*
+            (?:(?P<seconds>\d{{1,2}}(?:\.\d+)?)(?![\d.])\s*(?:{SECOND})?)?
+        )?
+    )
+    (?(before)|\s*(?:(?P<after>{HEMISPHERE})(?![a-z]))?)
+    """,
+    flags=re.IGNORECASE | re.VERBOSE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Coordinate:
+    degrees: float
+    minutes: float = 0.0
+    seconds: float = 0.0
+    negative: bool = False
+    hemisphere: str | None = None  # One of N, S, E, or W if the text has one
+
+    @property
+    def axis(self) -> int | None:
+        """Get whether a hemisphere letter marks this as a latitude or longitude."""
+        if self.hemisphere is None:
+            return None
+        return LAT if self.hemisphere in "NS" else LON
+
+    def to_degrees(self) -> float:
+        value = self.degrees + self.minutes / 60.0 + self.seconds / 3600.0
+        return -value if self.negative else value
+
+
+def to_coordinate(value: Any) -> Coordinate | None:
+    """Get a coordinate from a string or a number."""
+    if isinstance(value, str):
+        return parse(value)
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return Coordinate(abs(float(value)), negative=value < 0)
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse(text: str) -> Coordinate | None:
+    """
+    Get the coordinate that is the whole text, give or take wrapping punctuation.
+
+    Text with anything else in it, like "1 mile N of town", is not a coordinate
+    and neither is a bare whole number.
+    """
+    match = COORDINATE.fullmatch(text.strip(EDGES))
+    if match and (marked(match) or match["before"] or match["after"]):
+        return from_match(match)
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_pair(text: str) -> tuple[Coordinate | None, Coordinate | None]:
+    """
+    Get the latitude and longitude from verbatim coordinates.
+
+    Bare numbers like the 2N in T2N R3W are skipped. Without hemispheres the
+    latitude is taken to come first.
+    """
+    found = (from_match(m) for m in COORDINATE.finditer(text) if marked(m))
+    match list(islice(found, 2)):
+        case [first, second] if first.axis == LON or second.axis == LAT:
+            return second, first
+        case [first, second]:
+            return first, second
+    return None, None
+
+
+def from_match(match: re.Match) -> Coordinate:
+    letter = match["before"] or match["after"]
+    hemisphere = HEMISPHERES[letter.lower()] if letter else None
+    negative = hemisphere in "SW" if hemisphere else match["sign"] in ("-", "−")
+
+    return Coordinate(
+        float(match["decimal"] or match["degrees"]),
+        float(match["minutes"] or 0.0),
+        float(match["seconds"] or 0.0),
+        negative,
+        hemisphere,
+    )
+
+
+def marked(match: re.Match) -> bool:
+    """Check that there is more to the coordinate than a whole number."""
+    return bool(
+        match["decimal"]
+        or match["symbol1"]
+        or match["symbol2"]
+        or match["minutes"]
+        or match["sign"]
+    )
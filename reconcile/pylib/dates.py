@@ -0,0 +1,38 @@
+import re
+from calendar import IllegalMonthError
+from datetime import date
+from functools import lru_cache
+
+from dateutil import parser
+
+CACHE_SIZE = 100_000
+
+# ISO dates and the year-month-day strings built from OpenAI date dicts
+YMD = re.compile(r"([12]\d{3})-(\d{1,2})-(\d{1,2})")
+
+
+def parse_date(value: str) -> date:
+    """
+    Parse a date string just like dateutil.parser.parse(value).date() does.
+
+    Year-month-day strings are handled directly, anything else goes to dateutil.
+    Results, including failures, are cached across the whole run.
+    """
+    if (parsed := cached_parse(value)) is None:
+        msg = f"Unknown string format: {value}"
+        raise parser.ParserError(msg)
+    return parsed
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_parse(value: str) -> date | None:
+    if match := YMD.fullmatch(value):
+        try:
+            return date(*map(int, match.groups()))
+        except ValueError:  # Let dateutil deal with out of range parts
+            pass
+
+    try:
+        return parser.parse(value).date()
+    except (parser.ParserError, IllegalMonthError):
+        return None
@@ -0,0 +1,109 @@
+"""
+Map unknown OpenAI keys to the nearest Darwin Core term or action alias.
+
+Keys are compared without their namespace, case, or punctuation. Those that
+still differ are scored against the terms they share character trigrams with,
+found through an inverted index, using the Dice coefficient of the trigram sets.
+A term is never picked if it adds or drops a min, max, or verbatim qualifier,
+because elevationInFeet and maxElevationInFeet are close but not the same field.
+Every decision is cached because the same raw keys turn up on many labels.
+"""
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+NGRAM = 3
+THRESHOLD = 0.8
+CACHE_SIZE = 100_000
+
+NOISE = re.compile(r"^(dwc|dc):|[\W_]+")
+WORD = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+QUALIFIERS = {
+    "min": "min",
+    "minimum": "min",
+    "max": "max",
+    "maximum": "max",
+    "verbatim": "verbatim",
+}
+
+
+class KeyResolver:
+    def __init__(self, terms: Iterable[str], threshold: float = THRESHOLD):
+        self.terms = set(terms)
+        self.threshold = threshold
+
+        self.exact: dict[str, str] = {}
+        self.names: list[str] = []
+        self.sizes: list[int] = []
+        self.qualifiers: list[frozenset[str]] = []
+        self.index: dict[str, list[int]] = defaultdict(list)
+
+        for term in sorted(self.terms):
+            norm = normalize(term)
+            self.exact.setdefault(norm, term)
+            grams = ngrams(norm)
+            for gram in grams:
+                self.index[gram].append(len(self.names))
+            self.names.append(term)
+            self.sizes.append(len(grams))
+            self.qualifiers.append(qualifiers(term))
+
+        self.decide = lru_cache(maxsize=CACHE_SIZE)(self.nearest)
+
+    def resolve(self, key: str) -> tuple[str | None, float]:
+        """Get the term for the key and the confidence, or None if none is close."""
+        if key in self.terms:
+            return key, 1.0
+        term, score = self.decide(key)
+        return (term, score) if score >= self.threshold else (None, score)
+
+    def resolve_keys(self, dct: dict[str, Any]) -> dict[str, Any]:
+        """Rename the unknown keys that resolve to a term the dict does not have."""
+        resolved = {}
+        for key, value in dct.items():
+            if key not in self.terms:
+                term, _ = self.resolve(key)
+                if term and term not in dct and term not in resolved:
+                    key = term
+            resolved[key] = value
+        return resolved
+
+    def nearest(self, key: str) -> tuple[str | None, float]:
+        norm = normalize(key)
+        if term := self.exact.get(norm):
+            return term, 1.0
+
+        grams = ngrams(norm)
+        shared = Counter(i for gram in grams for i in self.index.get(gram, ()))
+        wanted = qualifiers(key)
+
+        best, best_score = None, 0.0
+        for i, count in shared.items():
+            if self.qualifiers[i] != wanted:
+                continue
+            score = 2.0 * count / (len(grams) + self.sizes[i])
+            if score > best_score or (score == best_score and i < best):
+                best, best_score = i, score
+
+        if best is None:
+            return None, 0.0
+        return self.names[best], round(best_score, 3)
+
+
+def normalize(key: str) -> str:
+    return NOISE.sub("", key.casefold())
+
+
+def qualifiers(key: str) -> frozenset[str]:
+    """Get the min, max, and verbatim words in a camelCase or snake_case key."""
+    words = (QUALIFIERS.get(w.casefold()) for w in WORD.findall(key))
+    return frozenset(w for w in words if w)
+
+
+def ngrams(norm: str) -> set[str]:
+    padded = f"^{norm}$"
+    return {padded[i : i + NGRAM] for i in range(max(len(padded) - NGRAM + 1, 1))}
@@ -2,16 +2,20 @@ from typing import Any, ClassVar
 
 import reconcile.pylib.darwin_core as dwc
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class AccessionNumber(Base):
     label: ClassVar[str] = "dwc:accessionNumber"
     aliases: ClassVar[list[str]] = Base.get_aliases(label)
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = False
     is_labeled_key: ClassVar[str] = "accessionNumberIsLabeled"
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, str]:
         # Use the traiter version if it is a labeled ID number & there is only 1
         if (
@@ -1,6 +1,7 @@
 from typing import Any, ClassVar
 
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class AdminUnit(Base):
@@ -17,10 +18,13 @@ class AdminUnit(Base):
     )
     co_match: ClassVar[list[str]] = Base.get_aliases(co_lb)
     muni_match: ClassVar[list[str]] = Base.get_aliases(muni_lb)
+    alias_lists: ClassVar[list[list[str]]] = [code_match, co_match, muni_match]
+    traiter_keys: ClassVar[list[str]] = [country_lb, st_lb, co_lb]
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, str]:
         obj = {}
 
@@ -3,6 +3,7 @@ from typing import Any, ClassVar
 
 from reconcile.pylib import darwin_core as dwc
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class Job(Base):
@@ -10,11 +11,14 @@ class Job(Base):
     id_lb: ClassVar[str] = "dwc:identifiedBy"
     rec_match: ClassVar[list[str]] = Base.get_aliases(rec_lb, """dwc:recordedByName""")
     id_match: ClassVar[list[str]] = Base.get_aliases(id_lb)
+    alias_lists: ClassVar[list[list[str]]] = [rec_match, id_match]
+    traiter_keys: ClassVar[list[str]] = []
+    needs_text: ClassVar[bool] = False
     record_no: ClassVar[str] = "dwc:recordNumber"
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
         o_rec = cls.search(other, cls.rec_match)
         o_id = cls.search(other, cls.id_match)
@@ -2,6 +2,7 @@ from typing import Any, ClassVar
 
 from reconcile.pylib.base import Base
 from reconcile.pylib.darwin_core import SEP
+from reconcile.pylib.text_context import TextContext
 
 
 class Locality(Base):
@@ -18,6 +19,9 @@ class Locality(Base):
     rem_match: ClassVar[list[str]] = Base.get_aliases(
         "dwc:locationRemarks dwc:localityRemarks dwc:locationNotes"
     )
+    alias_lists: ClassVar[list[list[str]]] = [loc_match, rem_match]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = True
 
     sub_match: ClassVar[list[str]] = loc_match + [
         loc.removeprefix("dwc:") for loc in loc_match
@@ -25,14 +29,14 @@ class Locality(Base):
 
     @classmethod
     def reconcile(  # noqa: C901
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
         o_locality = cls.search(other, cls.loc_match)
         o_remarks = cls.search(other, cls.rem_match)
         t_locality = traiter.get(cls.label, "")
 
         # Merge the traiter localities if they're separated by only whitespace
-        text = " ".join(text.split())
+        text = text.collapsed
         t_parts = t_locality.split(SEP)
         t_parts = " ".join(t_parts)
         if text.find(t_parts) > -1:
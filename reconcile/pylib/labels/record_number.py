@@ -2,6 +2,7 @@ from typing import Any, ClassVar
 
 import reconcile.pylib.darwin_core as dwc
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class RecordNumber(Base):
@@ -9,12 +10,15 @@ class RecordNumber(Base):
     aliases: ClassVar[list[str]] = Base.get_aliases(
         label, "dwc:record dwc:recordId dwc:recordedNumber dwc:catalogNumber"
     )
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = False
     is_labeled_key: ClassVar[str] = "recordNumberIsLabeled"
     cat_label: ClassVar[str] = "dwc:catalogNumber"
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, str]:
         # Use the traiter version if it is a labeled ID number & there is only 1
         if (
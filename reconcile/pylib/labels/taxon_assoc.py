@@ -1,8 +1,14 @@
 import re
+from functools import lru_cache
 from typing import Any, ClassVar
 
 from reconcile.pylib.base import Base
 from reconcile.pylib.darwin_core import SEP
+from reconcile.pylib.text_context import WORD, TextContext
+
+SPLIT = re.compile(r"[,;|]")
+MAX_RUN = 6  # Longer associates are looked for with a substring search
+CACHE_SIZE = 100_000
 
 
 class TaxonAssociation(Base):
@@ -13,25 +19,82 @@ class TaxonAssociation(Base):
         dwc:associatedSpecies dwc:additionalSpecies dwc:associatedFlora
         dwc:Associates""",
     )
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, str]:
         t_val = traiter.get(cls.label, "")
         t_vals = [v for v in t_val.split(SEP) if v]
-        t_val = t_val.casefold()
 
         o_val = cls.search(other, cls.aliases)
         o_vals = []
         match o_val:
             case str():
-                o_vals = re.split(r"\s*[,;|]\s*", o_val)
+                o_vals = split(o_val)
             case list():
                 o_vals = [v[0] if isinstance(v, list) else v for v in o_val]
+                o_vals = [v for v in o_vals if v and isinstance(v, str)]
+
+        # Keep all of traiter's associates. Drop an OpenAI associate when its words
+        # are already in one of traiter's, in order, ignoring case and punctuation,
+        # or when it repeats an OpenAI associate that was kept. So "quercus alba"
+        # is an exact match for "Quercus alba" and "Quercus" or "alba" are
+        # substring matches, but "Quercus rubra" is new. OpenAI associates are
+        # only checked against traiter's, so their order does not matter.
+        traiter_vals = tuple(t_vals)
+        runs = set().union(*map(word_runs, traiter_vals))
 
-        t_vals += [o_val for o_val in o_vals if o_val and o_val.casefold() not in t_val]
+        firsts = {}
+        for key, val in zip(map(associate_key, o_vals), o_vals, strict=True):
+            firsts.setdefault(key, val)  # Keep the first spelling of each one
+
+        t_vals += [
+            val
+            for key, val in firsts.items()
+            if key
+            and key not in runs
+            and (key.count(" ") < MAX_RUN or not in_long(key, traiter_vals))
+        ]
 
         vals = {cls.label: SEP.join(t_vals)} if t_vals else {}
 
         return vals
+
+
+def split(value: str) -> list[str]:
+    """
+    Split a list of associates and trim the spaces around the separators.
+
+    A regex that takes the spaces with the separator starts with optional spaces,
+    so it is tried at every character, which is much slower.
+    """
+    parts = SPLIT.split(value)
+    if len(parts) == 1:
+        return parts
+    return [parts[0].rstrip(), *(p.strip() for p in parts[1:-1]), parts[-1].lstrip()]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def associate_key(value: str) -> str:
+    """Get the associate's words, folded and joined with single spaces."""
+    return " ".join(WORD.findall(value.casefold()))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def word_runs(value: str) -> frozenset[str]:
+    """Get every run of the associate's words up to MAX_RUN long."""
+    words = associate_key(value).split()
+    return frozenset(
+        " ".join(words[i:j])
+        for i in range(len(words))
+        for j in range(i + 1, min(i + MAX_RUN, len(words)) + 1)
+    )
+
+
+def in_long(key: str, values: tuple[str, ...]) -> bool:
+    """Check if a key too long for the runs is in one of the values."""
+    return any(f" {key} " in f" {associate_key(v)} " for v in values)
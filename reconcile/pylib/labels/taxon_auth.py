@@ -1,6 +1,7 @@
 from typing import Any, ClassVar
 
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class TaxonAuthority(Base):
@@ -11,10 +12,13 @@ class TaxonAuthority(Base):
         dwc:scientificNameAuth dwc:scientificNameAuthor dwc:sciname_author
         """,
     )
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, str]:
         if o_val := cls.search(other, cls.aliases):
             return {cls.label: o_val}
@@ -1,6 +1,7 @@
 from typing import Any, ClassVar, NamedTuple
 
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class Label(NamedTuple):
@@ -65,10 +66,13 @@ class TaxonName(Base):
         # ),
         # Label(cultivar_lb, Base.get_aliases(cultivar_lb)),
     ]
+    alias_lists: ClassVar[list[list[str]]] = [m.match for m in matches]
+    traiter_keys: ClassVar[list[str]] = [m.label for m in matches]
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
         obj = {}
 
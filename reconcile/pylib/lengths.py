@@ -0,0 +1,89 @@
+"""
+Pull a length, or a range of lengths, and its unit out of strings like "1,200 ft".
+
+The unit patterns in the unit term CSVs are compiled with the number and range
+parts into one regular expression, so a string is parsed in a single pass. Parses
+are cached because the same strings turn up on many labels.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from reconcile.pylib import util
+
+TERMS = [
+    Path(__file__).parent / "unit_length_terms.csv",
+    Path(__file__).parent / "unit_tic_terms.csv",
+]
+
+CACHE_SIZE = 100_000
+
+NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?|\.\d+"
+DASH = r"\s*(?:-|–|—|to)\s*"
+
+
+@dataclass(frozen=True, slots=True)
+class Length:
+    low: float
+    high: float
+    unit: str | None = None  # The unit's short form like "ft", None if there is none
+
+    def to_meters(self) -> "Length":
+        if self.unit is None or self.unit == "m":
+            return self
+        factor = FACTORS_M[self.unit]
+        return Length(round(self.low * factor, 3), round(self.high * factor, 3), "m")
+
+
+def compile_parser(terms: list[dict]) -> tuple[re.Pattern, dict, dict]:
+    units = {t["pattern"].lower(): t["replace"] for t in terms}
+    factors_m = {t["replace"]: float(t["factor_cm"]) / 100.0 for t in terms}
+
+    patterns = sorted(units, key=len, reverse=True)
+    unit = rf"(?:{'|'.join(re.escape(p) for p in patterns)})(?![^\W\d_])"
+    parser = re.compile(
+        rf"(?P<low>{NUMBER})\s*(?P<unit1>{unit})?"
+        rf"(?:{DASH}(?P<high>{NUMBER})\s*(?P<unit2>{unit})?)?",
+        flags=re.IGNORECASE,
+    )
+    return parser, units, factors_m
+
+
+PARSER, UNITS, FACTORS_M = compile_parser(util.read_terms(TERMS))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse(text: str) -> Length | None:
+    """Get the first length or range in the text."""
+    if not (match := PARSER.search(text)):
+        return None
+
+    low = to_float(match["low"])
+    unit1 = UNITS.get(match["unit1"].lower()) if match["unit1"] else None
+    unit2 = UNITS.get(match["unit2"].lower()) if match["unit2"] else None
+
+    # A range has one unit, "350-400 m" or "350 m - 400 m"
+    if match["high"] is None or (unit1 and unit2 and unit1 != unit2):
+        return Length(low, low, unit1)
+
+    high = to_float(match["high"])
+    low, high = min(low, high), max(low, high)
+    return Length(low, high, unit1 or unit2)
+
+
+def to_length(value: Any) -> Length | None:
+    """Get a length from a string or a number. Numbers have no unit."""
+    if isinstance(value, str):
+        return parse(value)
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None
+    return Length(number, number)
+
+
+def to_float(number: str) -> float:
+    return float(number.replace(",", ""))
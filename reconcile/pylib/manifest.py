@@ -0,0 +1,87 @@
+"""
+Remember which labels were reconciled and from which inputs.
+
+The manifest is a JSONL file. The first line holds the fingerprint of the
+template that produced the output, every other line holds a stem and the
+signatures of its input files. Lines are appended as output is committed, so a
+run that crashes can resume where it stopped. Later lines win.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+
+class Manifest:
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.done: dict[str, Any] = {}
+        self.todo: dict[str, Any] = {}
+        self.pending: list[str] = []
+
+        self.load()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compact()
+        self.file = self.path.open("a")
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with self.path.open() as f:
+            lines = iter(f)
+            header = json.loads(next(lines, "{}"))
+            if header.get("fingerprint") != self.fingerprint:
+                logging.info("The template changed, reconciling all labels")
+                return
+
+            for ln in lines:
+                try:
+                    entry = json.loads(ln)
+                except json.JSONDecodeError:  # A line cut off by a crash
+                    continue
+                self.done[entry["stem"]] = entry["inputs"]
+
+    def stale(self, stems: list[str], sources) -> list[str]:
+        """Keep the stems that are new or whose inputs have changed."""
+        stale = []
+        for stem in stems:
+            inputs = [src.signature(stem) for src in sources]
+            if self.done.get(stem) != inputs:
+                self.todo[stem] = inputs
+                stale.append(stem)
+        return stale
+
+    def record(self, stem: str) -> None:
+        """Note a stem whose output is written but may not be committed yet."""
+        self.pending.append(stem)
+
+    def commit(self) -> None:
+        """Write the pending stems once their output is safely on disk."""
+        for stem in self.pending:
+            inputs = self.todo.pop(stem)
+            self.done[stem] = inputs
+            self.file.write(json.dumps({"stem": stem, "inputs": inputs}) + "\n")
+        self.pending = []
+        self.file.flush()
+
+    def compact(self) -> None:
+        temp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with temp.open("w") as f:
+            f.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+            for stem, inputs in self.done.items():
+                f.write(json.dumps({"stem": stem, "inputs": inputs}) + "\n")
+        temp.replace(self.path)
+
+    def close(self) -> None:
+        self.file.close()
+        self.compact()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
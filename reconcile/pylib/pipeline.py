@@ -0,0 +1,78 @@
+"""
+Overlap reading, reconciling, and writing rows.
+
+The inputs for upcoming items are read on a thread pool while the current rows
+are reconciled, and finished records are written on a thread of their own. Both
+sides hold a bounded number of items so memory stays flat, a full queue makes the
+producer wait, and both keep input order so the output is the same as a plain
+loop.
+"""
+
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+DONE = object()  # Tells the writer thread to stop
+
+
+def prefetch(
+    func: Callable[[Any], Any], items: Iterable, threads: int, window: int
+) -> Iterator:
+    """Map func over the items on a thread pool, up to window items ahead, in order."""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+        finally:
+            # Do not wait on reads nobody will use if the caller stopped early
+            for future in pending:
+                future.cancel()
+
+
+class BackgroundWriter:
+    """Call write for each item on a thread, in the order they were put."""
+
+    def __init__(self, write: Callable[[Any], None], size: int):
+        self.write = write
+        self.queue = queue.Queue(maxsize=size)
+        self.error = None
+        self.thread = threading.Thread(target=self.drain, daemon=True)
+        self.thread.start()
+
+    def drain(self) -> None:
+        while (item := self.queue.get()) is not DONE:
+            # Keep taking items after an error so put never blocks for good
+            if self.error is None:
+                try:
+                    self.write(item)
+                except Exception as err:  # noqa: BLE001
+                    self.error = err
+
+    def put(self, item: Any) -> None:
+        """Queue an item to write, waiting if the queue is full."""
+        if self.error:
+            raise self.error
+        self.queue.put(item)
+
+    def close(self) -> None:
+        """Write everything that is still queued and stop the thread."""
+        self.queue.put(DONE)
+        self.thread.join()
+
+    def __enter__(self):
+        return self.put
+
+    def __exit__(self, exc_type, *_):
+        self.close()
+        if exc_type is None and self.error:
+            raise self.error
@@ -0,0 +1,150 @@
+"""
+Read per-label input files from a directory or straight out of an archive.
+
+The member index of an archive is built once when it is opened, so looking up a
+label never lists or stats the archive again. Zip archives and uncompressed tar
+archives are memory-mapped and read in place. Compressed tar archives cannot be
+read at random, so they work but are much slower; use zip for those.
+"""
+
+import mmap
+import struct
+import tarfile
+import threading
+import zipfile
+import zlib
+from pathlib import Path
+
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+ZIP_HEADER = 30  # Fixed size part of a zip local file header
+ZIP_INFLATE = {
+    zipfile.ZIP_STORED: bytes,
+    zipfile.ZIP_DEFLATED: lambda data: zlib.decompress(data, -zlib.MAX_WBITS),
+}
+
+
+class DirSource:
+    def __init__(self, path: Path, suffix: str):
+        self.path = path
+        self.suffix = suffix
+
+    def stems(self) -> set[str]:
+        return {p.stem for p in self.path.glob(f"*{self.suffix}")}
+
+    def read(self, stem: str) -> str:
+        path = self.path / f"{stem}{self.suffix}"
+        with path.open() as f:
+            return f.read()
+
+    def signature(self, stem: str) -> list[int]:
+        stat = (self.path / f"{stem}{self.suffix}").stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def close(self) -> None:
+        return
+
+
+class ZipSource:
+    def __init__(self, path: Path, suffix: str):
+        self.path = path
+        self.suffix = suffix
+        self._zip = zipfile.ZipFile(path)
+        self._file = path.open("rb")
+        self._map = map_file(self._file)
+        self._index = {}
+        for info in self._zip.infolist():
+            name = Path(info.filename)
+            if not info.is_dir() and name.suffix == suffix:
+                self._index[name.stem] = info
+
+    def stems(self) -> set[str]:
+        return set(self._index)
+
+    def read(self, stem: str) -> str:
+        info = self._index[stem]
+        if self._map and info.compress_type in ZIP_INFLATE and not info.flag_bits & 1:
+            # Skip the local file header, its name & extra fields can differ
+            # from the central directory's
+            header = self._map[info.header_offset : info.header_offset + ZIP_HEADER]
+            name_len, extra_len = struct.unpack("<HH", header[26:30])
+            start = info.header_offset + ZIP_HEADER + name_len + extra_len
+            data = ZIP_INFLATE[info.compress_type](
+                self._map[start : start + info.compress_size]
+            )
+        else:
+            data = self._zip.read(info)
+        return data.decode("utf-8")
+
+    def signature(self, stem: str) -> list[int]:
+        info = self._index[stem]
+        return [info.file_size, info.CRC]
+
+    def close(self) -> None:
+        if self._map:
+            self._map.close()
+        self._file.close()
+        self._zip.close()
+
+
+class TarSource:
+    def __init__(self, path: Path, suffix: str):
+        self.path = path
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self._tar = tarfile.open(path)  # noqa: SIM115
+        self._index = {}
+        for info in self._tar:
+            name = Path(info.name)
+            if info.isfile() and name.suffix == suffix:
+                self._index[name.stem] = info
+
+        # Uncompressed members sit at fixed offsets so they can be sliced directly
+        self._file = None
+        self._map = None
+        if not is_compressed(path):
+            self._file = path.open("rb")
+            self._map = map_file(self._file)
+
+    def stems(self) -> set[str]:
+        return set(self._index)
+
+    def read(self, stem: str) -> str:
+        info = self._index[stem]
+        if self._map:
+            data = self._map[info.offset_data : info.offset_data + info.size]
+        else:
+            with self._lock, self._tar.extractfile(info) as f:
+                data = f.read()
+        return data.decode("utf-8")
+
+    def signature(self, stem: str) -> list[int]:
+        info = self._index[stem]
+        return [info.size, info.mtime, info.chksum]
+
+    def close(self) -> None:
+        if self._map:
+            self._map.close()
+        if self._file:
+            self._file.close()
+        self._tar.close()
+
+
+def open_source(path: Path, suffix: str) -> DirSource | ZipSource | TarSource:
+    """Open a directory or archive of files named like <stem><suffix>."""
+    if path.suffix == ".zip" and path.is_file():
+        return ZipSource(path, suffix)
+    if path.name.endswith(TAR_SUFFIXES) and path.is_file():
+        return TarSource(path, suffix)
+    return DirSource(path, suffix)
+
+
+def is_compressed(path: Path) -> bool:
+    return path.name.endswith(TAR_SUFFIXES[1:])
+
+
+def map_file(file) -> mmap.mmap | None:
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):  # Empty files & file systems without mmap
+        return None
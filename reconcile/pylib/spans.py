@@ -0,0 +1,61 @@
+"""
+Find where field values occur in a label's OCR text.
+
+Each distinct value is looked for with str.find, which scans in C, and a value
+shared by several fields is only looked for once. Values joined with SEP are
+looked for part by part.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Any
+
+from reconcile.pylib.darwin_core import SEP
+
+MIN_LENGTH = 3  # Shorter values match almost anywhere
+
+
+def locate(
+    text: str, fields: dict[str, Any], *, fold: bool = False
+) -> dict[str, list[tuple[int, int]]]:
+    """Get the character offsets of every field value found in the text."""
+    wanted = defaultdict(list)
+    for name, value in fields.items():
+        for pattern in candidates(value):
+            pattern = pattern.casefold() if fold else pattern
+            if len(pattern) >= MIN_LENGTH and name not in wanted[pattern]:
+                wanted[pattern].append(name)
+
+    spans = defaultdict(list)
+    for pattern, names in wanted.items():
+        for start in find_all(text, pattern):
+            for name in names:
+                spans[name].append((start, start + len(pattern)))
+
+    return {name: sorted(spans[name]) for name in fields if name in spans}
+
+
+def find_all(text: str, pattern: str) -> Iterator[int]:
+    """Yield the start of every match, overlaps included."""
+    start = text.find(pattern)
+    while start >= 0:
+        yield start
+        start = text.find(pattern, start + 1)
+
+
+def candidates(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        for part in value.split(SEP):
+            if part := " ".join(part.split()):
+                yield part
+
+    elif isinstance(value, int | float) and not isinstance(value, bool):
+        yield str(value)
+
+    elif isinstance(value, list):
+        for item in value:
+            yield from candidates(item)
+
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from candidates(item)
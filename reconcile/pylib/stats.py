@@ -0,0 +1,109 @@
+"""
+Count calls, errors, fields, and latency for each template action.
+
+Latencies go into log scaled buckets so the counters stay small, and counters
+from worker processes can simply be added together.
+"""
+
+import json
+import math
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from reconcile.pylib.text_context import TextContext
+
+BUCKETS_PER_DOUBLING = 8
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class ActionStats:
+    calls: int = 0
+    errors: int = 0
+    fields: int = 0
+    total_ns: int = 0
+    buckets: Counter = field(default_factory=Counter)
+
+    def add(self, elapsed_ns: int, fields: int, *, error: bool) -> None:
+        self.calls += 1
+        self.errors += int(error)
+        self.fields += fields
+        self.total_ns += elapsed_ns
+        self.buckets[int(math.log2(elapsed_ns + 1) * BUCKETS_PER_DOUBLING)] += 1
+
+    def merge(self, other: "ActionStats") -> None:
+        self.calls += other.calls
+        self.errors += other.errors
+        self.fields += other.fields
+        self.total_ns += other.total_ns
+        self.buckets.update(other.buckets)
+
+    def percentile(self, pct: float) -> float:
+        """Get the upper edge of the bucket holding the percentile in microseconds."""
+        rank = math.ceil(self.calls * pct / 100.0)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return 2.0 ** ((bucket + 1) / BUCKETS_PER_DOUBLING) / 1000.0
+        return 0.0
+
+    def report(self) -> dict[str, Any]:
+        report = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "fields": self.fields,
+            "total_ms": round(self.total_ns / 1e6, 3),
+        }
+        for pct in PERCENTILES:
+            report[f"p{pct}_us"] = round(self.percentile(pct), 3)
+        return report
+
+
+class Stats:
+    def __init__(self):
+        self.actions: dict[str, ActionStats] = {}
+
+    def call(
+        self, func: Callable, traiter: dict, other: dict, text: TextContext
+    ) -> dict[str, Any]:
+        """Run an action & time it. ValueErrors are counted and raised again."""
+        name = func.__self__.__name__
+        if not (action := self.actions.get(name)):
+            action = self.actions[name] = ActionStats()
+
+        start = time.perf_counter_ns()
+        try:
+            result = func(traiter, other, text)
+        except ValueError:
+            action.add(time.perf_counter_ns() - start, 0, error=True)
+            raise
+        action.add(time.perf_counter_ns() - start, len(result), error=False)
+        return result
+
+    def merge(self, other: "Stats") -> None:
+        for name, action in other.actions.items():
+            self.actions.setdefault(name, ActionStats()).merge(action)
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        ordered = sorted(self.actions.items(), key=lambda a: -a[1].total_ns)
+        return {name: action.report() for name, action in ordered}
+
+    def table(self) -> str:
+        report = self.report()
+        columns = ["calls", "errors", "fields", "total_ms"]
+        columns += [f"p{pct}_us" for pct in PERCENTILES]
+        width = max((len(name) for name in report), default=6)
+
+        lines = [f"{'action':<{width}}" + "".join(f"{c:>12}" for c in columns)]
+        for name, row in report.items():
+            lines.append(f"{name:<{width}}" + "".join(f"{row[c]:>12}" for c in columns))
+        return "\n".join(lines)
+
+    def save(self, path: Path) -> None:
+        with path.open("w") as f:
+            json.dump(self.report(), f, indent=4)
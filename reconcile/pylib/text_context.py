@@ -0,0 +1,48 @@
+"""
+Views of a label's OCR text that are shared by all of the actions for a row.
+
+Each view is built the first time an action asks for it and kept for the rest of
+the row, so no matter how many actions look at the text it is only normalized
+once.
+"""
+
+import re
+from functools import cached_property
+from typing import Any
+
+from reconcile.pylib import spans
+
+WORD = re.compile(r"\w+")
+
+
+class TextContext:
+    def __init__(self, text: str = ""):
+        self.text = text
+
+    @cached_property
+    def collapsed(self) -> str:
+        """The text with all whitespace, including newlines, collapsed to a space."""
+        return " ".join(self.text.split())
+
+    @cached_property
+    def folded(self) -> str:
+        """The collapsed text casefolded for case insensitive searches."""
+        return self.collapsed.casefold()
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        """The words in the folded text."""
+        return WORD.findall(self.folded)
+
+    def locate(self, fields: dict[str, Any]) -> dict[str, list[tuple[int, int]]]:
+        """Find where each field's values are in the collapsed text, ignoring case."""
+        # Casefolding can change the length of the text and throw the offsets off
+        if len(self.folded) == len(self.collapsed):
+            return spans.locate(self.folded, fields, fold=True)
+        return spans.locate(self.collapsed, fields)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
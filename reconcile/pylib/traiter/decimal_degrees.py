@@ -0,0 +1,53 @@
+"""
+Normalize OpenAI latitudes and longitudes to decimal degrees and check them.
+
+A value is parsed into degrees, minutes, seconds, and a hemisphere. When there is
+no decimal value the latitude and longitude are taken from the verbatim
+coordinates.
+"""
+
+from typing import Any
+
+from reconcile.pylib import coordinates
+from reconcile.pylib.coordinates import Coordinate
+from reconcile.pylib.traiter.verbatim_coordinates import VerbatimCoordinates
+
+PRECISION = 6  # About 0.1 m
+SIXTIETHS = 60.0  # Minutes and seconds are below this
+
+
+def find(cls, other: dict[str, Any]) -> tuple[Any, Coordinate | None]:
+    """Get the OpenAI value and the coordinate in it."""
+    if o_val := cls.search(other, cls.aliases):
+        return o_val, coordinates.to_coordinate(o_val)
+
+    verbatim = cls.search(other, VerbatimCoordinates.aliases)
+    if isinstance(verbatim, str) and (
+        coord := coordinates.parse_pair(verbatim)[cls.axis]
+    ):
+        return verbatim, coord
+
+    return None, None
+
+
+def reconcile(cls, other: dict[str, Any]) -> dict[str, Any]:
+    o_val, coord = find(cls, other)
+
+    # Nothing to normalize, pass it on as is
+    if coord is None:
+        return {cls.label: o_val} if o_val else {}
+
+    if coord.axis not in (None, cls.axis):
+        msg = f"BAD HEMISPHERE {cls.label}: {o_val}"
+        raise ValueError(msg)
+
+    degrees = coord.to_degrees()
+    if (
+        coord.minutes >= SIXTIETHS
+        or coord.seconds >= SIXTIETHS
+        or not abs(degrees) <= cls.limit
+    ):
+        msg = f"OUT OF RANGE {cls.label}: {o_val}"
+        raise ValueError(msg)
+
+    return {cls.label: round(degrees, PRECISION)}
@@ -1,6 +1,10 @@
 from typing import Any, ClassVar
 
+from reconcile.pylib import coordinates
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
+from reconcile.pylib.traiter import decimal_degrees
+from reconcile.pylib.traiter.verbatim_coordinates import VerbatimCoordinates
 
 
 class DecimalLatitude(Base):
@@ -8,11 +12,14 @@ class DecimalLatitude(Base):
     aliases: ClassVar[list[str]] = Base.get_aliases(
         label, "dwc:latitude dwc:verbatimLatitude"
     )
+    alias_lists: ClassVar[list[list[str]]] = [aliases, VerbatimCoordinates.aliases]
+    traiter_keys: ClassVar[list[str]] = []
+    needs_text: ClassVar[bool] = False
+    axis: ClassVar[int] = coordinates.LAT
+    limit: ClassVar[float] = 90.0
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
-    ) -> dict[str, str]:
-        if o_val := cls.search(other, cls.aliases):
-            return {cls.label: o_val}
-        return {}
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
+    ) -> dict[str, Any]:
+        return decimal_degrees.reconcile(cls, other)
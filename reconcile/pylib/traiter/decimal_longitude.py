@@ -1,6 +1,10 @@
 from typing import Any, ClassVar
 
+from reconcile.pylib import coordinates
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
+from reconcile.pylib.traiter import decimal_degrees
+from reconcile.pylib.traiter.verbatim_coordinates import VerbatimCoordinates
 
 
 class DecimalLongitude(Base):
@@ -8,11 +12,14 @@ class DecimalLongitude(Base):
     aliases: ClassVar[list[str]] = Base.get_aliases(
         label, "dwc:longitude dwc:verbatimLongitude"
     )
+    alias_lists: ClassVar[list[list[str]]] = [aliases, VerbatimCoordinates.aliases]
+    traiter_keys: ClassVar[list[str]] = []
+    needs_text: ClassVar[bool] = False
+    axis: ClassVar[int] = coordinates.LON
+    limit: ClassVar[float] = 180.0
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
-    ) -> dict[str, str]:
-        if o_val := cls.search(other, cls.aliases):
-            return {cls.label: o_val}
-        return {}
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
+    ) -> dict[str, Any]:
+        return decimal_degrees.reconcile(cls, other)
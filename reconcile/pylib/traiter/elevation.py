@@ -0,0 +1,20 @@
+"""Read OpenAI elevations for the elevation actions."""
+
+from typing import Any
+
+from reconcile.pylib import lengths
+
+
+def meters(value: Any, *, high: bool) -> tuple[float | None, bool]:
+    """
+    Get an OpenAI elevation in meters and whether it gave a unit.
+
+    High means use the top of a range.
+    """
+    if type(value) is float:
+        return value, False
+    if not (length := lengths.to_length(value)):
+        return None, False
+    stated = length.unit is not None
+    length = length.to_meters()
+    return (length.high if high else length.low), stated
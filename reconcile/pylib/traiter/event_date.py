@@ -8,9 +8,11 @@ from dateutil import parser
 
 from reconcile.pylib import darwin_core as dwc
 from reconcile.pylib.base import Base
+from reconcile.pylib.dates import parse_date
+from reconcile.pylib.text_context import TextContext
 
 
-@dataclass
+@dataclass(slots=True)
 class TraiterDate:
     key: str
     raw_date: str
@@ -18,13 +20,13 @@ class TraiterDate:
     has_roman: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenaiDate:
     key: str
     raw_date: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MergedDates:
     openai: OpenaiDate | None = None
     traiter: TraiterDate | None = None
@@ -40,12 +42,15 @@ class EventDate(Base):
         dwc:date """,
     )
     verbatim_aliases: ClassVar[list[str]] = Base.get_aliases(verbatim_label)
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label, verbatim_label]
+    needs_text: ClassVar[bool] = False
 
     clean_re: ClassVar[Any] = re.compile(r"date", flags=re.IGNORECASE | re.VERBOSE)
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
         o_val = cls.search(other, cls.aliases)
         t_val = traiter.get(cls.label, "")
@@ -118,7 +123,7 @@ class EventDate(Base):
         try:
             o_dates = []
             for o_date in date_list:
-                dt = parser.parse(o_date).date()
+                dt = parse_date(o_date)
                 key = dt.isoformat()
                 o_dates.append(OpenaiDate(raw_date=o_date, key=key))
         except (parser.ParserError, IllegalMonthError) as err:
@@ -135,7 +140,7 @@ class EventDate(Base):
             raw_verbs = [cls.clean_re.sub("", d) for d in t_verbatim.split(dwc.SEP)]
 
             for raw_date, raw_verb in zip(raw_dates, raw_verbs, strict=True):
-                dt = parser.parse(raw_date).date()
+                dt = parse_date(raw_date)
 
                 t_dates.append(
                     TraiterDate(
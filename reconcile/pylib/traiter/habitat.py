@@ -1,15 +1,19 @@
 from typing import Any, ClassVar
 
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class Habitat(Base):
     label: ClassVar[str] = "dwc:habitat"
     aliases: ClassVar[list[str]] = Base.get_aliases(label)
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = []
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
         if o_val := cls.search(other, cls.aliases):
             return {cls.label: o_val}
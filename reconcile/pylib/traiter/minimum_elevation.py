@@ -1,7 +1,8 @@
 from typing import Any, ClassVar
 
-from reconcile.pylib import util
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
+from reconcile.pylib.traiter import elevation
 
 
 class MinimumElevationInMeters(Base):
@@ -13,10 +14,13 @@ class MinimumElevationInMeters(Base):
         dwc:minElevationInMeters minimumElevationinMeters
         dwc:minElevationInFeet dwc:minimumElevationInFeet dwc:decimalAltitude """,
     )
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
         o_val = cls.search(other, cls.aliases)
 
@@ -25,7 +29,7 @@ class MinimumElevationInMeters(Base):
             msg = f"BAD FORMAT in OpenAI {cls.label} {o_val}"
             raise ValueError(msg)
 
-        o_val = util.to_positive_float(o_val) if o_val is not None else o_val
+        o_val, stated = elevation.meters(o_val, high=False)
 
         t_val = traiter.get(cls.label)
 
@@ -38,18 +42,14 @@ class MinimumElevationInMeters(Base):
             return {cls.label: t_val}
 
         # A simple match
-        if (
-            isinstance(o_val, float)
-            and isinstance(t_val, float)
-            and round(o_val) == round(t_val)
-        ):
+        if isinstance(t_val, float) and round(o_val) == round(t_val):
             return {cls.label: o_val}
 
-        # Try matching on feet
+        # Try matching on feet when OpenAI did not give a unit
         if o_val and t_val:
             factor = cls.factors_m["ft"]
             ft_to_m = round(o_val * factor, 3)
-            if ft_to_m == t_val:
+            if not stated and ft_to_m == t_val:
                 return {cls.label: ft_to_m}
 
             msg = f"MISMATCH {cls.label}: {o_val} != {t_val}"
@@ -1,18 +1,30 @@
 from typing import Any, ClassVar
 
+from reconcile.pylib import lengths
 from reconcile.pylib.base import Base
+from reconcile.pylib.text_context import TextContext
 
 
 class VerbatimElevation(Base):
     label: ClassVar[str] = "dwc:verbatimElevation"
     aliases: ClassVar[list[str]] = Base.get_aliases(label)
+    alias_lists: ClassVar[list[list[str]]] = [aliases]
+    traiter_keys: ClassVar[list[str]] = [label]
+    needs_text: ClassVar[bool] = False
 
     @classmethod
     def reconcile(
-        cls, traiter: dict[str, Any], other: dict[str, Any], text: str
+        cls, traiter: dict[str, Any], other: dict[str, Any], text: TextContext
     ) -> dict[str, Any]:
-        if o_val := cls.search(other, cls.aliases):
+        o_val = cls.search(other, cls.aliases)
+        t_val = traiter.get(cls.label)
+
+        # Use the traiter version when OpenAI's has no elevation in it
+        if isinstance(o_val, str) and t_val and not lengths.parse(o_val):
+            return {cls.label: t_val}
+
+        if o_val:
             return {cls.label: o_val}
-        if t_val := traiter.get(cls.label):
+        if t_val:
             return {cls.label: t_val}
         return {}
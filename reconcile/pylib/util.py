@@ -1,6 +1,8 @@
 import csv
 import re
+import sys
 from collections.abc import Iterable
+from functools import lru_cache
 from io import TextIOWrapper
 from pathlib import Path
 from typing import Any
@@ -10,14 +12,8 @@ from . import darwin_core as dwc
 
 MIN_LEN = 2
 
-
-def to_positive_float(value: Any) -> float | None:
-    if isinstance(value, str):
-        value = re.sub(r"[^\d./]", "", value) if value else ""
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
+KEY_CACHE_SIZE = 100_000
+KEY_PREFIX = re.compile(r"^(dcterms|dnz|dwc|dc)[:\-]", flags=re.IGNORECASE)
 
 
 def term_data(
@@ -50,12 +46,24 @@ def read_terms(csv_path: Path | Iterable[Path]) -> list[dict]:
     return terms
 
 
-def clean_key(key) -> str:
-    key = re.sub(r"^(dcterms|dnz|dwc|dc)[:\-]", "", key, flags=re.IGNORECASE)
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def clean_key(key: str) -> str:
+    """Normalize a raw key. The results are interned so rows share key objects."""
+    key = KEY_PREFIX.sub("", key)
     key = key.strip(":").strip()
 
     if len(key) > MIN_LEN:
         key = key[0].lower() + key[1:]
 
     key = dwc.ns(key)
-    return key
+    return sys.intern(key)
+
+
+def clean_keys(dct: dict[str, Any]) -> dict[str, Any]:
+    """Normalize all of the keys in a dict. If two keys clash the last one wins."""
+    return dict(zip(map(clean_key, dct), dct.values(), strict=True))
+
+
+def intern_keys(dct: dict[str, Any]) -> dict[str, Any]:
+    """Intern the keys of a dict so rows share key objects."""
+    return dict(zip(map(sys.intern, dct), dct.values(), strict=True))
@@ -0,0 +1,141 @@
+"""
+Write reconciled records.
+
+A record is a dict with "stem", "reconciled", and "errors" keys.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, TextIO
+
+COMPRESSORS = ["none", "gzip", "zstd"]
+SUFFIXES = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+BUFFER_SIZE = 1024 * 1024
+
+
+def to_line(record: dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+class DirWriter:
+    """Write one JSON file per stem."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.on_commit = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        path = self.path / f"{record['stem']}.json"
+        with path.open("w") as f:
+            json.dump(record["reconciled"], f, indent=4)
+        if self.on_commit:
+            self.on_commit()
+
+    def close(self) -> None:
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class StreamWriter:
+    """Write JSONL records to an open text stream like stdout, one as each finishes."""
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self.on_commit = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        self.out.write(to_line(record))
+        self.out.flush()  # A pipe is block buffered, so push each record on
+
+    def close(self) -> None:
+        self.out.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class ShardWriter:
+    """
+    Append JSONL records to size bounded shards.
+
+    The shard being written has a ".part" suffix. It is renamed once it is full or
+    the writer is closed, so every shard without the suffix is complete. Shard
+    numbers continue after any shards already in the directory. When a label is
+    reconciled again its newest record is in the highest numbered shard.
+    """
+
+    def __init__(self, path: Path, shard_size: int, compress: str = "none"):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.shard_size = shard_size
+        self.compress = compress
+        self.suffix = SUFFIXES[compress]
+        self.shard_no = self.next_shard_no()
+        self.stream = None
+        self.shard_path = None
+        self.written = 0
+        self.on_commit = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        if not self.stream:
+            self.open_shard()
+
+        line = to_line(record)
+        self.stream.write(line)
+        self.written += len(line)
+
+        if self.written >= self.shard_size:
+            self.close()
+
+    def close(self) -> None:
+        if not self.stream:
+            return
+        self.stream.close()
+        self.shard_path.rename(self.shard_path.with_suffix(""))
+        self.stream = None
+        self.shard_no += 1
+        if self.on_commit:
+            self.on_commit()
+
+    def open_shard(self) -> None:
+        name = f"reconciled_{self.shard_no:05d}{self.suffix}.part"
+        self.shard_path = self.path / name
+        self.stream = open_compressed(self.shard_path, self.compress)
+        self.written = 0
+
+    def next_shard_no(self) -> int:
+        shards = [p.name.split(".")[0] for p in self.path.glob("reconciled_*.jsonl*")]
+        numbers = [int(s.removeprefix("reconciled_")) for s in shards]
+        return max(numbers, default=-1) + 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def open_compressed(path: Path, compress: str) -> TextIO:
+    if compress == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8")
+
+    if compress == "zstd":
+        try:
+            import zstandard  # noqa: PLC0415
+        except ImportError as err:
+            msg = "zstd compression needs the zstandard package"
+            raise ImportError(msg) from err
+        return zstandard.open(path, "wt", encoding="utf-8")
+
+    return path.open("w", encoding="utf-8", buffering=BUFFER_SIZE)
@@ -1,20 +1,29 @@
 #!/usr/bin/env python3
 import argparse
+import gzip
 import json
 import logging
 import sys
 import textwrap
-from collections import defaultdict
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing, nullcontext, redirect_stdout
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from pprint import pp
-from typing import Any
+from typing import Any, NamedTuple, TextIO
 
 from util.pylib import log
 
 import reconcile.pylib.darwin_core as dwc
 from reconcile.pylib.base import Template
+from reconcile.pylib.cache import ResultCache
+from reconcile.pylib.census import census, key_report, scan_keys
+from reconcile.pylib.key_resolver import THRESHOLD, KeyResolver
 from reconcile.pylib.labels.accession_number import AccessionNumber
 from reconcile.pylib.labels.admin_unit import AdminUnit
 from reconcile.pylib.labels.job import Job
@@ -26,6 +35,11 @@ from reconcile.pylib.labels.taxon_assoc import TaxonAssociation
 from reconcile.pylib.labels.taxon_auth import TaxonAuthority
 from reconcile.pylib.labels.taxon_name import TaxonName
 from reconcile.pylib.labels.taxon_rank import TaxonRank
+from reconcile.pylib.manifest import Manifest
+from reconcile.pylib.pipeline import BackgroundWriter, prefetch
+from reconcile.pylib.sources import open_source
+from reconcile.pylib.stats import Stats
+from reconcile.pylib.text_context import TextContext
 from reconcile.pylib.traiter.coordinate_precision import CoordinatePrecision
 from reconcile.pylib.traiter.coordinate_uncertainty import CoordinateUncertainty
 from reconcile.pylib.traiter.decimal_latitude import DecimalLatitude
@@ -38,7 +52,13 @@ from reconcile.pylib.traiter.minimum_elevation import MinimumElevationInMeters
 from reconcile.pylib.traiter.verbatim_coordinates import VerbatimCoordinates
 from reconcile.pylib.traiter.verbatim_elevation import VerbatimElevation
 from reconcile.pylib.traiter.verbatim_system import VerbatimCoordinateSystem
-from reconcile.pylib.util import clean_key
+from reconcile.pylib.util import clean_keys, intern_keys
+from reconcile.pylib.writers import COMPRESSORS, DirWriter, ShardWriter, StreamWriter
+
+CHUNK_SIZE = 100
+MB = 1024 * 1024
+
+Writer = DirWriter | ShardWriter | StreamWriter
 
 
 class Verbose(IntEnum):
@@ -48,55 +68,117 @@ class Verbose(IntEnum):
     FIELDS = 3
 
 
-@dataclass
+class Sources(NamedTuple):
+    text: Any
+    traiter: Any
+    openai: Any
+
+    def close(self) -> None:
+        for source in self:
+            source.close()
+
+
+@dataclass(slots=True)
 class Row:
     stem: str
     text: str = ""
     traiter: dict[str, Any] = field(default_factory=dict)
     openai: dict[str, Any] = field(default_factory=dict)
     reconciled: dict[str, Any] = field(default_factory=dict)
-    missed: set[str] = field(default_factory=set)
+    missed: tuple[str, ...] = ()
     errors: list[str] = field(default_factory=list)
+    text_src: Any = field(default=None, repr=False)  # Read the text on demand
+    provenance: dict[str, list] | None = None
+    plan: tuple | None = field(default=None, repr=False)  # Set by make_plan
 
-    def get_text(self, text_dir):
-        path = text_dir / f"{self.stem}.txt"
-        with path.open() as f:
-            text = f.read()
+    def get_text(self, text_src):
+        text = text_src.read(self.stem)
         self.text = compress(text)
 
-    def get_traiter(self, traiter_dir):
-        path = traiter_dir / f"{self.stem}.json"
-        with path.open() as f:
-            self.traiter = json.load(f)
-
-    def get_openai(self, openai_dir):
-        path = openai_dir / f"{self.stem}.json"
-        with path.open() as f:
-            openai = json.load(f)
-
-        new = {}
-        for key, value in openai.items():
-            new[key] = value
-            if isinstance(value, dict):
-                new |= dict(value.items())
-
-        self.openai = {clean_key(k): v for k, v in new.items()}
-
-    def reconcile(self, template):
-        for func in template.actions:
-            try:
-                self.reconciled |= func(self.traiter, self.openai, self.text)
-            except ValueError as err:
-                self.errors.append(str(err))
-
-        self.missed = set(self.openai.keys()) - set(self.reconciled.keys())
-
-    def save_traits(self, parsed_dir):
+    def need_text(self):
+        if self.text_src:
+            self.get_text(self.text_src)
+            self.text_src = None
+
+    def get_traiter(self, traiter_src):
+        self.traiter = intern_keys(json.loads(traiter_src.read(self.stem)))
+
+    def get_openai(self, openai_src):
+        self.set_openai(json.loads(openai_src.read(self.stem)))
+
+    def set_openai(self, openai):
+        # Lift the keys of nested dicts to the top level. Only copy if there are any
+        if any(isinstance(v, dict) for v in openai.values()):
+            flat = {}
+            for key, value in openai.items():
+                flat[key] = value
+                if isinstance(value, dict):
+                    flat |= value
+            openai = flat
+
+        self.openai = clean_keys(openai)
+
+    def make_plan(self, template):
+        """Route the OpenAI keys and pick the actions that will run on this row."""
+        other = template.route(template.resolve(self.openai))
+        self.plan = (self.traiter, other, template.select(self.traiter, other))
+        return self.plan
+
+    def reconcile(self, template, cache=None):
+        _, other, actions = self.plan or self.make_plan(template)
+        self.plan = None
+
+        # Only read the OCR text when an action in this row uses it
+        uses_text = any(func.__self__.needs_text for func in actions)
+        if uses_text:
+            self.need_text()
+
+        text = self.text if uses_text else ""
+        key = cache.key(text, self.traiter, other) if cache else None
+
+        if cache and (hit := cache.get(key)):
+            self.reconciled, self.errors = hit
+
+        else:
+            stats = template.stats
+            context = TextContext(text)
+            for func in actions:
+                try:
+                    if stats:
+                        self.reconciled |= stats.call(
+                            func, self.traiter, other, context
+                        )
+                    else:
+                        self.reconciled |= func(self.traiter, other, context)
+                except ValueError as err:
+                    self.errors.append(str(err))
+
+            if cache:
+                cache.put(key, self.reconciled, self.errors)
+
+        self.missed = tuple(k for k in other if k not in self.reconciled)
+
+    def to_record(self) -> dict[str, Any]:
         keys = sorted(self.reconciled.keys())
         self.reconciled = {k: self.reconciled[k] for k in keys}
-        path = parsed_dir / f"{self.stem}.json"
-        with path.open("w") as f:
-            json.dump(self.reconciled, f, indent=4)
+        record = {
+            "stem": self.stem,
+            "reconciled": self.reconciled,
+            "errors": self.errors,
+        }
+        if self.provenance is not None:
+            record["provenance"] = {
+                k: self.provenance[k] for k in keys if k in self.provenance
+            }
+        return record
+
+    @classmethod
+    def from_record(cls, record):
+        row = cls(stem=record["stem"])
+        row.text = compress(record.get("text", ""))
+        row.traiter = intern_keys(record.get("traiter", {}))
+        row.set_openai(record.get("openai", {}))
+        return row
 
     def verbose(self, verbose):
         if (verbose == Verbose.ERRORS and self.errors) or (verbose > Verbose.ERRORS):
@@ -129,9 +211,20 @@ def main():
     log.started()
     args = parse_args()
 
-    text_stems = {p.stem for p in args.text_dir.glob("*")}
-    traiter_stems = {p.stem for p in args.traiter_dir.glob("*")}
-    openai_stems = {p.stem for p in args.openai_dir.glob("*")}
+    if args.stream:
+        reconcile_stream(args)
+    else:
+        reconcile_dirs(args)
+
+    log.finished()
+
+
+def reconcile_dirs(args: argparse.Namespace) -> None:
+    sources = open_sources(args)
+
+    text_stems = sources.text.stems()
+    traiter_stems = sources.traiter.stems()
+    openai_stems = sources.openai.stems()
 
     args.formatted_dir.mkdir(parents=True, exist_ok=True)
 
@@ -151,74 +244,321 @@ def main():
         stems = [s for s in stems if s == args.stem]
 
     if args.count:
-        count_keys(args.openai_dir)
+        count_keys(args)
 
     else:
-        template = Template(
-            EventDate,
-            MinimumElevationInMeters,
-            MaximumElevationInMeters,
-            VerbatimElevation,
-            Habitat,
-            DecimalLatitude,
-            DecimalLongitude,
-            CoordinateUncertainty,
-            CoordinatePrecision,
-            GeodeticDatum,
-            VerbatimCoordinateSystem,
-            VerbatimCoordinates,
-            AdminUnit,
-            Job,  # Put Job before RecordNumber because Job can fill RecordNumber
-            RecordNumber,  # Put after Job, so it can override whatever Job did
-            AccessionNumber,
-            RecordedById,
-            Locality,
-            Sex,
-            TaxonAssociation,
-            TaxonAuthority,
-            TaxonName,
-            TaxonRank,
-        )
+        with open_manifest(args) as manifest, open_writer(args) as writer:
+            if manifest:
+                stems = manifest.stale(stems, sources)
+                writer.on_commit = manifest.commit
+                msg = f"New or changed: {len(stems)}"
+                logging.info(msg)
+
+            rows = reconcile_rows(stems, row_from_stem, sources, args)
+            save_rows(rows, writer, args, manifest)
+
+    sources.close()
+
 
-        total_errors = 0
-        rows = []
+def reconcile_stream(args: argparse.Namespace) -> None:
+    """Reconcile NDJSON records and write the results to stdout as they finish."""
+    writer = StreamWriter(sys.stdout)
 
-        for stem in stems:
-            row = Row(stem=stem)
-            rows.append(row)
+    # Keep stdout clean for the records
+    with open_stream(args.stream) as lines, redirect_stdout(sys.stderr), writer:
+        lines = (ln for ln in lines if ln.strip())
+        rows = reconcile_rows(lines, row_from_line, None, args)
+        save_rows(rows, writer, args)
 
-            row.get_text(args.text_dir)
-            row.get_traiter(args.traiter_dir)
-            row.get_openai(args.openai_dir)
 
-            row.reconcile(template)
+def save_rows(
+    rows: Iterator[Row],
+    writer: Writer,
+    args: argparse.Namespace,
+    manifest: Manifest | None = None,
+) -> None:
+    total_errors = 0
+    missed = Counter()
 
-            row.save_traits(args.formatted_dir)
+    def save(record: dict[str, Any]) -> None:
+        if manifest:
+            manifest.record(record["stem"])
+        writer.write(record)
+
+    # Write on a thread of its own while the next rows are reconciled
+    output = BackgroundWriter(save, CHUNK_SIZE) if args.prefetch else nullcontext(save)
+
+    # Rows come back in input order, even from the worker pool, so the error
+    # budget is spent exactly as it is in a serial run
+    with closing(rows), output as save_record:
+        for row in rows:
+            save_record(row.to_record())
 
             row.verbose(args.verbose)
 
+            missed.update(row.missed)
             total_errors += len(row.errors)
             if total_errors > args.max_errors:
                 msg = f"Max errors of {args.max_errors} exceeded"
                 logging.error(msg)
                 sys.exit(1)
 
-        show_missed_keys(rows, args.verbose)
+    show_missed_keys(missed, args.verbose)
 
-        msg = f"Total errors: {total_errors}"
-        logging.info(msg)
+    msg = f"Total errors: {total_errors}"
+    logging.info(msg)
 
-    log.finished()
 
+def build_template(args: argparse.Namespace) -> Template:
+    template = Template(
+        EventDate,
+        MinimumElevationInMeters,
+        MaximumElevationInMeters,
+        VerbatimElevation,
+        Habitat,
+        DecimalLatitude,
+        DecimalLongitude,
+        CoordinateUncertainty,
+        CoordinatePrecision,
+        GeodeticDatum,
+        VerbatimCoordinateSystem,
+        VerbatimCoordinates,
+        AdminUnit,
+        Job,  # Put Job before RecordNumber because Job can fill RecordNumber
+        RecordNumber,  # Put after Job, so it can override whatever Job did
+        AccessionNumber,
+        RecordedById,
+        Locality,
+        Sex,
+        TaxonAssociation,
+        TaxonAuthority,
+        TaxonName,
+        TaxonRank,
+    )
+    template.stats = Stats() if args.stats else None
+    if args.fuzzy_keys:
+        template.resolver = KeyResolver(template.known_keys(), args.fuzzy_threshold)
+    return template
+
+
+def open_sources(args: argparse.Namespace) -> Sources | None:
+    if args.stream:
+        return None
+    return Sources(
+        text=open_source(args.text_dir, ".txt"),
+        traiter=open_source(args.traiter_dir, ".json"),
+        openai=open_source(args.openai_dir, ".json"),
+    )
 
-def show_missed_keys(rows, verbose):
-    if verbose < Verbose.FIELDS:
-        return
 
-    missed = defaultdict(int)
+def open_writer(args: argparse.Namespace) -> Writer:
+    if args.output_format == "jsonl":
+        return ShardWriter(args.formatted_dir, args.shard_size * MB, args.compress)
+    return DirWriter(args.formatted_dir)
+
+
+def open_manifest(args: argparse.Namespace) -> Manifest | nullcontext:
+    if args.manifest:
+        return Manifest(args.manifest, build_template(args).fingerprint)
+    return nullcontext()
+
+
+def open_cache(
+    args: argparse.Namespace, template: Template, *, clear: bool = False
+) -> ResultCache | None:
+    if not args.cache:
+        return None
+    cache = ResultCache(args.cache, template.fingerprint, args.cache_size)
+    if clear:
+        cache.clear()
+    return cache
+
+
+def open_stream(path: str) -> TextIO:
+    if path == "-":
+        return nullcontext(sys.stdin)
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+    return Path(path).open()
+
+
+def row_from_stem(stem: str, sources: Sources) -> Row:
+    row = Row(stem=stem, text_src=sources.text)
+    row.get_traiter(sources.traiter)
+    row.get_openai(sources.openai)
+    return row
+
+
+def row_from_line(line: str, _sources: None) -> Row:
+    return Row.from_record(json.loads(line))
+
+
+def load_rows(
+    items: Iterable[str],
+    load_row: Callable[[str, Sources | None], Row],
+    sources: Sources | None,
+    template: Template,
+    args: argparse.Namespace,
+) -> Iterator[Row]:
+    """Load the rows in input order, reading ahead on a thread pool if asked."""
+    if not args.prefetch:
+        return (load_row(item, sources) for item in items)
+    load = partial(prefetch_row, load_row=load_row, sources=sources, template=template)
+    return prefetch(load, items, args.prefetch, CHUNK_SIZE)
+
+
+def prefetch_row(
+    item: str,
+    load_row: Callable[[str, Sources | None], Row],
+    sources: Sources | None,
+    template: Template,
+) -> Row:
+    """Load a row and, if any of its actions use it, read the text too."""
+    row = load_row(item, sources)
+    _, _, actions = row.make_plan(template)
+    if any(func.__self__.needs_text for func in actions):
+        row.need_text()
+    return row
+
+
+def reconcile_row(
+    row: Row, template: Template, cache: ResultCache | None, args: argparse.Namespace
+) -> None:
+    row.reconcile(template, cache)
+
+    if args.provenance:
+        row.need_text()
+        row.provenance = TextContext(row.text).locate(row.reconciled)
+
+    # Show the text when debugging even if no action needed it
+    if args.verbose >= Verbose.INPUT:
+        row.need_text()
+    row.text_src = None
+
+
+def reconcile_rows(
+    items: Iterable[str],
+    load_row: Callable[[str, Sources | None], Row],
+    sources: Sources | None,
+    args: argparse.Namespace,
+) -> Iterator[Row]:
+    """Load and reconcile the items and yield the rows in input order."""
+    template = build_template(args)
+
+    try:
+        if args.workers <= 1:
+            yield from reconcile_serial(items, load_row, sources, template, args)
+        else:
+            yield from reconcile_parallel(items, load_row, template, args)
+
+    finally:
+        if template.stats:
+            template.stats.save(args.stats)
+            print(template.stats.table(), file=sys.stderr)
+
+
+def reconcile_serial(
+    items: Iterable[str],
+    load_row: Callable[[str, Sources | None], Row],
+    sources: Sources | None,
+    template: Template,
+    args: argparse.Namespace,
+) -> Iterator[Row]:
+    cache = open_cache(args, template, clear=args.clear_cache)
+    rows = load_rows(items, load_row, sources, template, args)
+    try:
+        for row in rows:
+            reconcile_row(row, template, cache, args)
+            yield row
+    finally:
+        rows.close()
+        if cache:
+            cache.close()
+
+
+def reconcile_parallel(
+    items: Iterable[str],
+    load_row: Callable[[str, Sources | None], Row],
+    template: Template,
+    args: argparse.Namespace,
+) -> Iterator[Row]:
+    # Have the parent set up the cache, so workers do not race to clear it
+    if cache := open_cache(args, template, clear=args.clear_cache):
+        cache.close()
+
+    executor = ProcessPoolExecutor(
+        max_workers=args.workers, initializer=init_worker, initargs=(args,)
+    )
+    try:
+        # Keep a bounded window of chunks in flight
+        pending = deque()
+        items = iter(items)
+        while chunk := list(islice(items, CHUNK_SIZE)):
+            pending.append(executor.submit(reconcile_chunk, chunk, load_row))
+            if len(pending) >= args.workers * 2:
+                yield from chunk_rows(pending.popleft(), template)
+
+        while pending:
+            yield from chunk_rows(pending.popleft(), template)
+
+    finally:
+        # Do not wait on queued chunks if the caller stopped early
+        executor.shutdown(cancel_futures=True)
+
+        # Workers never close their caches, so trim it here
+        if cache := open_cache(args, template):
+            cache.close()
+
+
+def chunk_rows(future: Future, template: Template) -> list[Row]:
+    rows, stats = future.result()
+    if template.stats:
+        template.stats.merge(stats)
+    return rows
+
+
+# Each worker process builds its template and opens its inputs once, then reuses
+# them for every chunk
+_worker_args: argparse.Namespace | None = None
+_worker_template: Template | None = None
+_worker_sources: Sources | None = None
+_worker_cache: ResultCache | None = None
+
+
+def init_worker(args: argparse.Namespace) -> None:
+    global _worker_args, _worker_template, _worker_sources, _worker_cache
+    _worker_args = args
+    _worker_template = build_template(args)
+    _worker_sources = open_sources(args)
+    _worker_cache = open_cache(args, _worker_template)
+
+
+def reconcile_chunk(
+    items: list[str], load_row: Callable[[str, Sources | None], Row]
+) -> tuple[list[Row], Stats | None]:
+    rows = [load_row(item, _worker_sources) for item in items]
     for row in rows:
-        for m in row.missed:
-            missed[m] += 1
+        reconcile_row(row, _worker_template, _worker_cache, _worker_args)
+    if _worker_cache:
+        _worker_cache.commit()
+
+    # The parent only needs the results, so do not send the inputs back unless
+    # they are shown
+    if _worker_args.verbose < Verbose.INPUT:
+        for row in rows:
+            row.text, row.traiter, row.openai = "", {}, {}
+
+    # Hand this chunk's counts to the parent and start over
+    stats = _worker_template.stats
+    if stats:
+        _worker_template.stats = Stats()
+
+    return rows, stats
+
+
+def show_missed_keys(missed: Counter, verbose):
+    if verbose < Verbose.FIELDS:
+        return
 
     missed = dict(sorted(missed.items()))
     print("---- Missed Keys ", "-" * 40)
@@ -231,30 +571,14 @@ def show_missed_keys(rows, verbose):
     print()
 
 
-def count_keys(dir_) -> dict[str, int]:
-    keys = defaultdict(int)
-
-    for path in dir_.glob("*.json"):
-        with path.open() as f:
-            obj = json.load(f)
-
-        for key in obj:
-            key = clean_key(key)
-            keys[key] += 1
-
-    keys = dict(sorted(keys.items()))
+def count_keys(args: argparse.Namespace) -> None:
+    source = open_source(args.openai_dir, ".json")
+    stems = sorted(source.stems())
+    source.close()
 
-    valid_count = 0
-    print("key,valid,count")
-    for key, count in keys.items():
-        valid = 1 if key in dwc.CORE else ""
-        print(f"{key},{valid},{count}")
-        valid_count += 1 if valid else 0
-
-    print(f"{valid_count}/{len(keys)} valid keys")
-    print(f"{len(keys) - valid_count}/{len(keys)} invalid keys")
-
-    return keys
+    paths = [(args.openai_dir, ".json")]
+    keys = census(scan_keys, stems, paths, args.workers)
+    key_report(keys)
 
 
 def compress(text: str) -> str:
@@ -274,34 +598,102 @@ def parse_args() -> argparse.Namespace:
         "--text-dir",
         metavar="PATH",
         type=Path,
-        required=True,
-        help="""Get OCR text output files from this directory.""",
+        help="""Get OCR text output files from this directory or from a zip or tar
+            archive.""",
     )
 
     arg_parser.add_argument(
         "--openai-dir",
         metavar="PATH",
         type=Path,
-        required=True,
-        help="""Get OpenAI JSON files from this directory.""",
+        help="""Get OpenAI JSON files from this directory or from a zip or tar
+            archive.""",
     )
 
     arg_parser.add_argument(
         "--traiter-dir",
         metavar="PATH",
         type=Path,
-        required=True,
-        help="""Get traiter JSON files from this directory.""",
+        help="""Get traiter JSON files from this directory or from a zip or tar
+            archive.""",
     )
 
     arg_parser.add_argument(
         "--formatted-dir",
         metavar="PATH",
         type=Path,
-        required=True,
         help="""Put the formatted result files into this directory.""",
     )
 
+    arg_parser.add_argument(
+        "--manifest",
+        metavar="PATH",
+        type=Path,
+        help="""Keep track of the reconciled labels in this file. Only labels that are
+            new, whose input files changed, or that were not finished by an earlier
+            run are reconciled. Everything is reconciled again if the reconcilers
+            change.""",
+    )
+
+    arg_parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        type=Path,
+        help="""Cache reconciled results in this SQLite file and reuse them for labels
+            with identical inputs. The cache is emptied when the reconcilers
+            change.""",
+    )
+
+    arg_parser.add_argument(
+        "--cache-size",
+        metavar="INT",
+        type=int,
+        default=1_000_000,
+        help="""Keep at most this many results in the cache. The least recently
+            used results are evicted first. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="""Empty the cache before reconciling.""",
+    )
+
+    arg_parser.add_argument(
+        "--output-format",
+        choices=["files", "jsonl"],
+        default="files",
+        help="""Write one JSON file per label into the --formatted-dir, or append
+            compact records to JSONL shards in that directory.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--shard-size",
+        metavar="MB",
+        type=int,
+        default=256,
+        help="""Start a new JSONL shard after this many megabytes of records.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--compress",
+        choices=COMPRESSORS,
+        default=COMPRESSORS[0],
+        help="""Compress the JSONL shards. zstd needs the zstandard package.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--stream",
+        metavar="PATH",
+        help="""Read NDJSON records with "stem", "text", "traiter", and "openai" fields
+            from this file (.jsonl or .jsonl.gz) or from stdin when the PATH is "-".
+            Reconciled records are written to stdout as NDJSON instead of using the
+            input and output directories.""",
+    )
+
     arg_parser.add_argument(
         "--count",
         action="store_true",
@@ -317,6 +709,61 @@ def parse_args() -> argparse.Namespace:
         help="""Allow this many errors before exiting.""",
     )
 
+    arg_parser.add_argument(
+        "--workers",
+        "-w",
+        metavar="INT",
+        type=int,
+        default=1,
+        help="""Reconcile labels in this many processes. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--prefetch",
+        metavar="INT",
+        type=int,
+        default=0,
+        help="""Read the inputs for upcoming labels on this many threads, and write
+            the output on a thread of its own, while the current labels are
+            reconciled. This helps on slow or remote storage. With --workers only
+            the writing is moved to a thread, the workers do their own reading.
+            The output is the same, in the same order. 0 means read and write in
+            line. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--fuzzy-keys",
+        action="store_true",
+        help="""Rename OpenAI keys that are not Darwin Core terms or known aliases
+            to the closest one, so near misses like dwc:minimumElevationinMeters
+            are reconciled instead of missed.""",
+    )
+
+    arg_parser.add_argument(
+        "--fuzzy-threshold",
+        type=float,
+        metavar="SCORE",
+        default=THRESHOLD,
+        help="""How similar, from 0 to 1, a key has to be to a term before it is
+            renamed with --fuzzy-keys. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--provenance",
+        action="store_true",
+        help="""Add where each reconciled value was found in the OCR text to the
+            records. Offsets are into the text with its whitespace collapsed. It
+            needs --output-format jsonl or --stream.""",
+    )
+
+    arg_parser.add_argument(
+        "--stats",
+        metavar="PATH",
+        type=Path,
+        help="""Time every reconciler and count its calls, errors, and fields. The
+            report is saved to this JSON file and printed as a table.""",
+    )
+
     arg_parser.add_argument(
         "--verbose",
         "-v",
@@ -331,6 +778,18 @@ def parse_args() -> argparse.Namespace:
     )
 
     args = arg_parser.parse_args()
+
+    dirs = (args.text_dir, args.openai_dir, args.traiter_dir, args.formatted_dir)
+    if not args.stream and not all(dirs):
+        arg_parser.error(
+            "--text-dir, --openai-dir, --traiter-dir, and --formatted-dir are "
+            "required unless you use --stream"
+        )
+
+    # Label files only hold the reconciled fields, so there is nowhere to put it
+    if args.provenance and not args.stream and args.output_format != "jsonl":
+        arg_parser.error("--provenance needs --output-format jsonl or --stream")
+
     return args
 
 
@@ -1,18 +1,70 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import json
 import logging
+import os
 import random
+import re
 import textwrap
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 from util.pylib import log
 
+STRATA = ["none", "source", "missing"]
+MISSING_FIELDS = (
+    "dwc:scientificName",
+    "dwc:eventDate",
+    "dwc:verbatimLocality",
+    "dwc:recordedBy",
+)
+BATCH_SIZE = 1000  # Reconciled files read at once when stratifying on their fields
+SPARE = 2  # Reservoirs hold this times the sample to replace labels missing inputs
+
+
+class Reservoir:
+    """Keep a uniform random sample of a stream whose length is unknown."""
+
+    def __init__(self, size: int, rng: random.Random):
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.items = []
+
+    def add(self, item) -> None:
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        elif (i := self.rng.randrange(self.seen)) < self.size:
+            self.items[i] = item
+
 
 def main():
     log.started()
     args = parse_args()
 
+    if args.method == "reservoir" or args.strata != "none":
+        sample = reservoir_sample(args)
+    else:
+        sample = simple_sample(args)
+
+    with args.csv_file.open("w") as out, ThreadPoolExecutor(args.workers) as executor:
+        writer = csv.writer(out)
+        writer.writerow(
+            ["name", "ocr_text", "reconciled", "traiter_output", "gpt4_output"]
+        )
+        for row in executor.map(partial(read_row, args), sample):
+            if row:
+                writer.writerow(row)
+
+    log.finished()
+
+
+def simple_sample(args: argparse.Namespace) -> list[str]:
     random.seed(args.seed)
 
     text_paths = {p.stem for p in args.text_dir.glob("*.txt")}
@@ -36,34 +88,119 @@ def main():
     )
     logging.info(msg)
 
-    sample = random.sample(paths, args.sample)
+    return random.sample(paths, args.sample)
 
-    with args.csv_file.open("w") as out:
-        writer = csv.writer(out)
-        writer.writerow(
-            ["name", "ocr_text", "reconciled", "traiter_output", "gpt4_output"]
+
+def reservoir_sample(args: argparse.Namespace) -> list[str]:
+    """
+    Sample the reconciled stems in one pass over the directory.
+
+    The other directories are not listed. Instead the inputs of sampled labels are
+    checked, and a label missing one is replaced by a spare from its reservoir.
+    Each stratum keeps its own reservoir and the sample is split evenly between the
+    strata, so rare strata still show up. The sample is the same for a given seed
+    and set of reconciled files.
+    """
+    rng = random.Random(args.seed)  # noqa: S311
+    reservoirs: dict[str, Reservoir] = {}
+    source = re.compile(args.source_pattern)
+
+    with ThreadPoolExecutor(args.workers) as executor:
+        for batch in batched(json_stems(args.reconciled_dir), BATCH_SIZE):
+            if args.strata == "missing":
+                strata = executor.map(partial(missing_stratum, args), batch)
+            elif args.strata == "source":
+                strata = [m.group() if (m := source.search(s)) else "" for s in batch]
+            else:
+                strata = ["all"] * len(batch)
+
+            for stem, stratum in zip(batch, strata, strict=True):
+                if stratum not in reservoirs:
+                    reservoirs[stratum] = Reservoir(args.sample * SPARE, rng)
+                reservoirs[stratum].add(stem)
+
+    counts = ", ".join(f"{k}: {r.seen}" for k, r in sorted(reservoirs.items()))
+    msg = f"Reconciled: {counts}"
+    logging.info(msg)
+
+    sample = []
+    for stratum, quota in allocate(reservoirs, args.sample).items():
+        items = reservoirs[stratum].items
+        items = rng.sample(items, len(items))
+        found = list(islice(filter(partial(has_inputs, args), items), quota))
+        if len(found) < quota:
+            msg = f"Only {len(found)} of {quota} {stratum} labels have all inputs"
+            logging.warning(msg)
+        sample += found
+    return sample
+
+
+def allocate(reservoirs: dict[str, Reservoir], size: int) -> dict[str, int]:
+    """Split the sample size evenly over the strata, refilling from the bigger ones."""
+    quotas = dict.fromkeys(sorted(reservoirs), 0)
+    open_ = [k for k in quotas if reservoirs[k].items]
+    left = size
+    while left and open_:
+        share = max(left // len(open_), 1)
+        for stratum in list(open_):
+            take = min(share, len(reservoirs[stratum].items) - quotas[stratum], left)
+            quotas[stratum] += take
+            left -= take
+            if quotas[stratum] == len(reservoirs[stratum].items):
+                open_.remove(stratum)
+    return quotas
+
+
+def json_stems(dir_: Path) -> list[str]:
+    """List the stems in a fixed order, scandir order changes between file systems."""
+    with os.scandir(dir_) as entries:
+        return sorted(
+            e.name.removesuffix(".json") for e in entries if e.name.endswith(".json")
         )
 
-        for stem in sample:
-            path = args.text_dir / f"{stem}.txt"
-            with path.open() as f:
-                text = f.read()
 
-            path = args.reconciled_dir / f"{stem}.json"
-            with path.open() as f:
-                reconciled = f.read()
+def has_inputs(args: argparse.Namespace, stem: str) -> bool:
+    return all(
+        path.exists()
+        for path in (
+            args.text_dir / f"{stem}.txt",
+            args.traiter_dir / f"{stem}.json",
+            args.openai_dir / f"{stem}.json",
+        )
+    )
 
-            path = args.openai_dir / f"{stem}.json"
-            with path.open() as f:
-                openai = f.read()
 
-            path = args.traiter_dir / f"{stem}.json"
-            with path.open() as f:
-                traiter = f.read()
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    items = iter(items)
+    while batch := list(islice(items, size)):
+        yield batch
 
-            writer.writerow([stem, text, reconciled, traiter, openai])
 
-    log.finished()
+def missing_stratum(args: argparse.Namespace, stem: str) -> str:
+    path = args.reconciled_dir / f"{stem}.json"
+    with path.open() as f:
+        reconciled = json.load(f)
+    missing = sum(1 for k in args.missing_fields if not reconciled.get(k))
+    return f"missing {missing}"
+
+
+def read_row(args: argparse.Namespace, stem: str) -> list[str] | None:
+    paths = [
+        args.text_dir / f"{stem}.txt",
+        args.reconciled_dir / f"{stem}.json",
+        args.traiter_dir / f"{stem}.json",
+        args.openai_dir / f"{stem}.json",
+    ]
+    texts = []
+    for path in paths:
+        try:
+            with path.open() as f:
+                texts.append(f.read())
+        except FileNotFoundError:
+            msg = f"Skipping {stem}, {path} is missing"
+            logging.warning(msg)
+            return None
+    return [stem, *texts]
 
 
 def parse_args() -> argparse.Namespace:
@@ -130,6 +267,51 @@ def parse_args() -> argparse.Namespace:
         help="""Random number seed.""",
     )
 
+    arg_parser.add_argument(
+        "--method",
+        choices=["sample", "reservoir"],
+        default="sample",
+        help="""How to sample. "sample" lists all four directories and samples
+            their common stems. "reservoir" samples the reconciled directory in one
+            pass, which is much faster on big corpora. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--strata",
+        choices=STRATA,
+        default="none",
+        help="""Split the sample evenly between groups of labels. "source" groups
+            them on the part of the stem matched by --source-pattern. "missing"
+            groups them on how many of the --missing-fields are empty, this reads
+            every reconciled file. Any strata imply --method reservoir.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--source-pattern",
+        metavar="REGEX",
+        default=r"^[^_]+",
+        help="""The part of a stem that names its source dataset.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--missing-fields",
+        metavar="FIELD",
+        nargs="*",
+        default=MISSING_FIELDS,
+        help="""Reconciled fields to check with --strata missing.""",
+    )
+
+    arg_parser.add_argument(
+        "--workers",
+        "-w",
+        metavar="INT",
+        type=int,
+        default=8,
+        help="""Read files on this many threads. (default: %(default)s)""",
+    )
+
     args = arg_parser.parse_args()
     return args
 
@@ -0,0 +1,29 @@
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from reconcile.pylib.base import Template
+from reconcile.pylib.traiter.decimal_latitude import DecimalLatitude
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_fingerprint_01(self):
+        """The helpers the actions import are hashed along with the actions."""
+        read = []
+        read_bytes = Path.read_bytes
+
+        def record(path):
+            read.append(path.name)
+            return read_bytes(path)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=record):
+            Template(DecimalLatitude).fingerprint  # noqa: B018
+
+        for name in ["coordinates.py", "dates.py", "text_context.py", "lengths.py"]:
+            with self.subTest(name=name):
+                self.assertIn(name, read)
+
+    def test_fingerprint_02(self):
+        """The fingerprint is the same from one call to the next."""
+        template = Template(DecimalLatitude)
+        self.assertEqual(template.fingerprint, template.fingerprint)
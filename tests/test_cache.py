@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from reconcile.pylib.cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def test_result_cache_01(self):
+        """A result can be read back before and after it is written."""
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "cache.sqlite"
+            with closing(ResultCache(path, "fp", 10)) as cache:
+                key = cache.key("text", {"a": 1}, {"b": 2})
+                self.assertIsNone(cache.get(key))
+                cache.put(key, {"a": 1}, ["error"])
+                self.assertEqual(cache.get(key), ({"a": 1}, ["error"]))
+                cache.commit()
+
+            with closing(ResultCache(path, "fp", 10)) as cache:
+                self.assertEqual(cache.get(key), ({"a": 1}, ["error"]))
+
+    def test_result_cache_02(self):
+        """Gets and puts hold no transaction open between writes."""
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "cache.sqlite"
+            with closing(ResultCache(path, "fp", 10)) as cache:
+                key = cache.key("text", {}, {})
+                cache.put(key, {}, [])
+                self.assertFalse(cache.db.in_transaction)
+                cache.commit()
+                cache.get(key)
+                self.assertFalse(cache.db.in_transaction)
+
+    def test_result_cache_03(self):
+        """A new fingerprint empties the cache."""
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "cache.sqlite"
+            with closing(ResultCache(path, "old", 10)) as cache:
+                cache.put(cache.key("", {}, {}), {}, [])
+
+            with closing(ResultCache(path, "new", 10)) as cache:
+                self.assertIsNone(cache.get(cache.key("", {}, {})))
+
+    def test_result_cache_04(self):
+        """The least recently used results are evicted past the size limit."""
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "cache.sqlite"
+            with closing(ResultCache(path, "fp", 2)) as cache:
+                keys = [cache.key(str(i), {}, {}) for i in range(3)]
+                for key in keys:
+                    cache.put(key, {}, [])
+                    cache.commit()
+                cache.get(keys[0])
+
+            with closing(ResultCache(path, "fp", 2)) as cache:
+                self.assertIsNotNone(cache.get(keys[0]))
+                self.assertIsNone(cache.get(keys[1]))
+                self.assertIsNotNone(cache.get(keys[2]))
@@ -0,0 +1,40 @@
+import json
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from reconcile.pylib.census import census, scan_keys
+
+
+class TestCensus(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp.name)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def write(self, name, text):
+        (self.path / name).write_text(text)
+
+    def test_scan_keys_01(self):
+        """It counts the files each top level key is in, not nested keys."""
+        self.write("a.json", json.dumps({"dwc:country": "US", "x": {"dwc:y": 1}}))
+        self.write("b.json", json.dumps({"dwc:country": "MX", "z": ["dwc:y"]}))
+        keys = census(scan_keys, ["a", "b"], [(self.path, ".json")])
+        self.assertEqual(keys, Counter({"dwc:country": 2, "dwc:x": 1, "dwc:z": 1}))
+
+    def test_scan_keys_02(self):
+        """A repeated key is counted once, escapes and odd strings are read."""
+        self.write("a.json", '{"a": "}", "a": "{", "b\\"c": "[,]", "\\u0064": 1}')
+        keys = census(scan_keys, ["a"], [(self.path, ".json")])
+        self.assertEqual(keys, Counter({"dwc:a": 1, 'dwc:b"c': 1, "dwc:d": 1}))
+
+    def test_scan_keys_03(self):
+        """Chunks in worker processes add up to the same counts."""
+        for i in range(5):
+            self.write(f"{i}.json", json.dumps({"a": i, f"k{i % 2}": 1}))
+        stems = [str(i) for i in range(5)]
+        keys = census(scan_keys, stems, [(self.path, ".json")], workers=2)
+        self.assertEqual(keys, Counter({"dwc:a": 5, "dwc:k0": 3, "dwc:k1": 2}))
@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from reconcile.pylib.compare import HashCache, same_files
+
+
+class TestSameFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp.name)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def pair(self, data1, data2):
+        path1, path2 = self.path / "1.json", self.path / "2.json"
+        path1.write_bytes(data1)
+        path2.write_bytes(data2)
+        return path1, path2
+
+    def test_same_files_01(self):
+        """It compares files like a text mode read would."""
+        cases = [
+            (b'{"a": 1}\n', b'{"a": 1}\n', True),
+            (b'{"a": 1}\n', b'{"a": 2}\n', False),
+            (b'{"a": 1}\n', b'{"a": 1}', False),
+            (b'{"a": 1}\r\n', b'{"a": 1}\n', True),
+            (b'{"a":\r1}\r\n', b'{"a":\n1}\n', True),
+            (b'{"a": 1}\r\n', b'{"a": 2}\n', False),
+        ]
+        for data1, data2, expect in cases:
+            with self.subTest(data1=data1, data2=data2):
+                pair = self.pair(data1, data2)
+                self.assertEqual(same_files([pair], HashCache()), [expect])
+
+    def test_same_files_02(self):
+        """Results are in the order of the pairs."""
+        pairs = []
+        for i, data in enumerate([b"a", b"b", b"a"]):
+            path = self.path / f"{i}.txt"
+            path.write_bytes(data)
+            pairs.append((self.path / "0.txt", path))
+        self.assertEqual(same_files(pairs, HashCache(), workers=2), [True, False, True])
+
+    def test_same_files_03(self):
+        """Each file is read once, and not at all once its digests are saved."""
+        manifest = self.path / "hashes.json"
+        pairs = [
+            self.pair(b'{"a": 1}\r\n', b'{"a": 1}\n'),
+            (self.path / "3.json", self.path / "4.json"),
+        ]
+        pairs[1][0].write_bytes(b'{"a": 1}\n')
+        pairs[1][1].write_bytes(b'{"a": 22}\n')
+
+        read = []
+        read_bytes = Path.read_bytes
+
+        def record(path):
+            read.append(path.name)
+            return read_bytes(path)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=record):
+            with HashCache(manifest) as hashes:
+                self.assertEqual(same_files(pairs, hashes), [True, False])
+            self.assertEqual(sorted(read), ["1.json", "2.json", "3.json", "4.json"])
+
+            read.clear()
+            with HashCache(manifest) as hashes:
+                self.assertEqual(same_files(pairs, hashes), [True, False])
+            self.assertEqual(read, [])
@@ -0,0 +1,124 @@
+import unittest
+
+from reconcile.pylib.coordinates import parse, parse_pair
+from reconcile.pylib.text_context import TextContext
+from reconcile.pylib.traiter.decimal_latitude import DecimalLatitude
+from reconcile.pylib.traiter.decimal_longitude import DecimalLongitude
+
+LAT = DecimalLatitude.label
+LON = DecimalLongitude.label
+
+
+def degrees(text):
+    coord = parse(text)
+    return round(coord.to_degrees(), 6) if coord else None
+
+
+class TestParse(unittest.TestCase):
+    def test_parse_01(self):
+        """It reads decimal degrees and degrees, minutes, and seconds."""
+        cases = [
+            ("34.5", 34.5),
+            ("-34.5", -34.5),
+            ("−120.25°", -120.25),
+            ("34.5 S", -34.5),
+            ("S 34.5", -34.5),
+            ("30°16'15\"N", 30.270833),
+            ("30 16.25 N", 30.270833),
+            ("12°30'15.5\" W", -12.504306),
+            ("N. 30°16'", 30.266667),
+        ]
+        for text, expect in cases:
+            with self.subTest(text=text):
+                self.assertEqual(degrees(text), expect)
+
+    def test_parse_02(self):
+        """Degrees, minutes, and seconds can be marked by words, letters, or colons."""
+        cases = [
+            ("34 Degrees South", -34.0),
+            ("12 deg 30 min S", -12.5),
+            ("12 degs. 30 mins. 15 secs. E", 12.504167),
+            ("35:30:15S", -35.504167),
+            ("35d30m15s S", -35.504167),
+            ("35d30m15S", -35.504167),
+            ("35d30m15s", 35.504167),
+            ("120:30 W", -120.5),
+        ]
+        for text, expect in cases:
+            with self.subTest(text=text):
+                self.assertEqual(degrees(text), expect)
+
+    def test_parse_03(self):
+        """Punctuation and spaces around a coordinate are ignored."""
+        self.assertEqual(degrees("(30° 16' N)"), 30.266667)
+        self.assertEqual(degrees(" 34 S. "), -34.0)
+
+    def test_parse_04(self):
+        """Text that is more than a coordinate, or a bare whole number, is not one."""
+        for text in [
+            "Sec. 12, T2N R3W",
+            "1 mile N of town",
+            "2 km E of X",
+            "34.5, -120.3",
+            "12 m",
+            "34",
+            "",
+        ]:
+            with self.subTest(text=text):
+                self.assertIsNone(parse(text))
+
+
+class TestParsePair(unittest.TestCase):
+    def test_parse_pair_01(self):
+        """It finds the latitude and longitude in verbatim coordinates."""
+        cases = [
+            ("35°30'N 120°15'W", (35.5, -120.25)),
+            ("120:30W 35:30N", (35.5, -120.5)),
+            ("34.5, -120.3", (34.5, -120.3)),
+            ("35d30m15s S 120d30m W", (-35.5042, -120.5)),
+        ]
+        for text, expect in cases:
+            with self.subTest(text=text):
+                lat, lon = parse_pair(text)
+                self.assertEqual(
+                    (round(lat.to_degrees(), 4), round(lon.to_degrees(), 4)), expect
+                )
+
+    def test_parse_pair_02(self):
+        """Township and range numbers are not coordinates."""
+        self.assertEqual(parse_pair("Sec. 12, T2N R3W"), (None, None))
+
+
+class TestDecimalDegrees(unittest.TestCase):
+    def reconcile(self, cls, other):
+        return cls.reconcile({}, other, TextContext())
+
+    def test_decimal_degrees_01(self):
+        """Coordinates are normalized to decimal degrees."""
+        self.assertEqual(
+            self.reconcile(DecimalLatitude, {LAT: "34 Degrees South"}), {LAT: -34.0}
+        )
+        self.assertEqual(self.reconcile(DecimalLongitude, {LON: -120.5}), {LON: -120.5})
+
+    def test_decimal_degrees_02(self):
+        """Values that are not coordinates are passed on unchanged."""
+        for value in ["1 mile N of town", "Sec. 12, T2N R3W", "34"]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    self.reconcile(DecimalLatitude, {LAT: value}), {LAT: value}
+                )
+
+    def test_decimal_degrees_03(self):
+        """The verbatim coordinates fill in missing values."""
+        other = {"dwc:verbatimCoordinates": "35°30'N 120°15'W"}
+        self.assertEqual(self.reconcile(DecimalLatitude, other), {LAT: 35.5})
+        self.assertEqual(self.reconcile(DecimalLongitude, other), {LON: -120.25})
+
+    def test_decimal_degrees_04(self):
+        """Wrong hemispheres and out of range values are errors."""
+        with self.assertRaisesRegex(ValueError, "BAD HEMISPHERE"):  # noqa: PT027
+            self.reconcile(DecimalLatitude, {LAT: "120:30 W"})
+        with self.assertRaisesRegex(ValueError, "OUT OF RANGE"):  # noqa: PT027
+            self.reconcile(DecimalLatitude, {LAT: "95.5 N"})
+        with self.assertRaisesRegex(ValueError, "OUT OF RANGE"):  # noqa: PT027
+            self.reconcile(DecimalLongitude, {LON: "120 75' W"})
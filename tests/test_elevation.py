@@ -0,0 +1,73 @@
+import unittest
+
+from reconcile.pylib.text_context import TextContext
+from reconcile.pylib.traiter.maximum_elevation import MaximumElevationInMeters
+from reconcile.pylib.traiter.minimum_elevation import MinimumElevationInMeters
+
+MIN = MinimumElevationInMeters.label
+MAX = MaximumElevationInMeters.label
+
+
+def reconcile(cls, traiter, other):
+    return cls.reconcile(traiter, other, TextContext())
+
+
+class TestMinimumElevation(unittest.TestCase):
+    def test_minimum_elevation_01(self):
+        """Values in meters or feet match the traiter value."""
+        cases = [
+            ({MIN: 1200.0}, {MIN: "1200 m"}, 1200.0),
+            ({MIN: 365.76}, {MIN: "1200 ft"}, 365.76),
+            ({MIN: 365.76}, {MIN: "1200"}, 365.76),
+            ({MIN: 365.76}, {MIN: 1200}, 365.76),
+            ({MIN: 1524.0}, {MIN: "5000'"}, 1524.0),
+        ]
+        for traiter, other, expect in cases:
+            with self.subTest(other=other):
+                self.assertEqual(
+                    reconcile(MinimumElevationInMeters, traiter, other), {MIN: expect}
+                )
+
+    def test_minimum_elevation_02(self):
+        """It uses the bottom of a range."""
+        self.assertEqual(
+            reconcile(MinimumElevationInMeters, {MIN: 350.0}, {MIN: "350-400 m"}),
+            {MIN: 350.0},
+        )
+
+    def test_minimum_elevation_03(self):
+        """A stated unit is not read as feet."""
+        with self.assertRaisesRegex(ValueError, "MISMATCH"):  # noqa: PT027
+            reconcile(MinimumElevationInMeters, {MIN: 365.76}, {MIN: "1200 m"})
+
+    def test_minimum_elevation_04(self):
+        """Values OpenAI does not have, or traiter does not have."""
+        self.assertEqual(reconcile(MinimumElevationInMeters, {MIN: 100.0}, {}), {})
+        with self.assertRaisesRegex(ValueError, "NO TRAITER MATCH"):  # noqa: PT027
+            reconcile(MinimumElevationInMeters, {}, {MIN: "350 m"})
+        with self.assertRaisesRegex(ValueError, "BAD FORMAT"):  # noqa: PT027
+            reconcile(MinimumElevationInMeters, {MIN: 1.0}, {MIN: ["1 m"]})
+
+
+class TestMaximumElevation(unittest.TestCase):
+    def test_maximum_elevation_01(self):
+        """It uses the top of a range."""
+        self.assertEqual(
+            reconcile(MaximumElevationInMeters, {MAX: 400.0}, {MAX: "350-400 m"}),
+            {MAX: 400.0},
+        )
+        self.assertEqual(
+            reconcile(MaximumElevationInMeters, {MAX: 457.2}, {MAX: "1200-1500 ft"}),
+            {MAX: 457.2},
+        )
+
+    def test_maximum_elevation_02(self):
+        """It falls back on the traiter value."""
+        self.assertEqual(
+            reconcile(MaximumElevationInMeters, {MAX: 100.0}, {}), {MAX: 100.0}
+        )
+
+    def test_maximum_elevation_03(self):
+        """Values that disagree are an error."""
+        with self.assertRaisesRegex(ValueError, "MISMATCH"):  # noqa: PT027
+            reconcile(MaximumElevationInMeters, {MAX: 100.0}, {MAX: "500 m"})
@@ -0,0 +1,72 @@
+import unittest
+
+from reconcile.pylib.key_resolver import KeyResolver
+
+TERMS = [
+    "dwc:maxElevationInFeet",
+    "dwc:minElevationInFeet",
+    "dwc:maximumElevationInMeters",
+    "dwc:minimumElevationInMeters",
+    "dwc:verbatimElevation",
+    "dwc:locality",
+    "dwc:scientificName",
+]
+
+
+class TestKeyResolver(unittest.TestCase):
+    def setUp(self):
+        self.resolver = KeyResolver(TERMS)
+
+    def test_key_resolver_01(self):
+        """A known term is kept as is."""
+        self.assertEqual(self.resolver.resolve("dwc:locality"), ("dwc:locality", 1.0))
+
+    def test_key_resolver_02(self):
+        """Case and punctuation are ignored."""
+        self.assertEqual(
+            self.resolver.resolve("dwc:minimumElevationinMeters"),
+            ("dwc:minimumElevationInMeters", 1.0),
+        )
+        self.assertEqual(
+            self.resolver.resolve("scientific_name"), ("dwc:scientificName", 1.0)
+        )
+
+    def test_key_resolver_03(self):
+        """A misspelled key is renamed."""
+        self.assertEqual(self.resolver.resolve("dwc:locallity")[0], "dwc:locality")
+        self.assertEqual(
+            self.resolver.resolve("dwc:maximumElevationInMeter")[0],
+            "dwc:maximumElevationInMeters",
+        )
+
+    def test_key_resolver_04(self):
+        """A near miss that adds or drops a qualifier is not renamed."""
+        for key in [
+            "dwc:elevationInFeet",
+            "dwc:elevationInMeters",
+            "dwc:elevation",
+            "dwc:verbatimLocality",
+        ]:
+            with self.subTest(key=key):
+                self.assertIsNone(self.resolver.resolve(key)[0])
+
+    def test_key_resolver_05(self):
+        """Short and long forms of a qualifier are the same qualifier."""
+        self.assertEqual(
+            self.resolver.resolve("dwc:maxElevationInMeters")[0],
+            "dwc:maximumElevationInMeters",
+        )
+        self.assertEqual(
+            self.resolver.resolve("dwc:minimumElevationInFeet")[0],
+            "dwc:minElevationInFeet",
+        )
+
+    def test_key_resolver_06(self):
+        """Unknown keys that resolve to a term the dict has are left alone."""
+        self.assertEqual(
+            self.resolver.resolve_keys({"dwc:locallity": "a", "dwc:locality": "b"}),
+            {"dwc:locallity": "a", "dwc:locality": "b"},
+        )
+        self.assertEqual(
+            self.resolver.resolve_keys({"dwc:locallity": "a"}), {"dwc:locality": "a"}
+        )
@@ -0,0 +1,60 @@
+import unittest
+
+from reconcile.pylib.lengths import Length, parse, to_length
+
+
+class TestLengths(unittest.TestCase):
+    def test_parse_01(self):
+        """It reads units from the unit term CSVs."""
+        cases = [
+            ("1200 m", Length(1200.0, 1200.0, "m")),
+            ("1200 feet", Length(1200.0, 1200.0, "ft")),
+            ("100ft", Length(100.0, 100.0, "ft")),
+            ("about 30 M.", Length(30.0, 30.0, "m")),
+            ("5000'", Length(5000.0, 5000.0, "ft")),
+            ("200 m elevation", Length(200.0, 200.0, "m")),
+            ("1200", Length(1200.0, 1200.0, None)),
+        ]
+        for text, expect in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse(text), expect)
+
+    def test_parse_02(self):
+        """It reads ranges with one unit or a unit on each end."""
+        cases = [
+            ("350-400 m", Length(350.0, 400.0, "m")),
+            ("350 m - 400 m", Length(350.0, 400.0, "m")),
+            ("12 to 15 meters", Length(12.0, 15.0, "m")),
+            ("1200 ft – 1500 ft", Length(1200.0, 1500.0, "ft")),
+            ("400-350 m", Length(350.0, 400.0, "m")),
+        ]
+        for text, expect in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse(text), expect)
+
+    def test_parse_03(self):
+        """A range with two different units is not a range."""
+        self.assertEqual(parse("350 m - 400 ft"), Length(350.0, 350.0, "m"))
+
+    def test_parse_04(self):
+        """Thousands separators and bare decimals are numbers."""
+        self.assertEqual(parse("elev. 2,345.5 ft"), Length(2345.5, 2345.5, "ft"))
+        self.assertEqual(parse(".5 m"), Length(0.5, 0.5, "m"))
+
+    def test_parse_05(self):
+        """Text without a number is not a length."""
+        self.assertIsNone(parse("no number"))
+
+    def test_to_meters_01(self):
+        """It converts both ends of a range to meters."""
+        self.assertEqual(
+            parse("1200 ft – 1500 ft").to_meters(), Length(365.76, 457.2, "m")
+        )
+        self.assertEqual(parse("1200").to_meters(), Length(1200.0, 1200.0, None))
+
+    def test_to_length_01(self):
+        """Numbers have no unit, other things are not lengths."""
+        self.assertEqual(to_length(1200), Length(1200.0, 1200.0))
+        self.assertEqual(to_length("1200 ft"), Length(1200.0, 1200.0, "ft"))
+        self.assertIsNone(to_length(["1200"]))
+        self.assertIsNone(to_length(None))
@@ -0,0 +1,33 @@
+import contextlib
+import io
+import sys
+import unittest
+from unittest.mock import patch
+
+from reconcile.reconcile_traits import parse_args
+
+DIRS = [
+    "--text-dir=text",
+    "--openai-dir=openai",
+    "--traiter-dir=traiter",
+    "--formatted-dir=out",
+]
+
+
+def parsed(*argv):
+    with patch.object(sys, "argv", ["reconcile-traits", *argv]):
+        return parse_args()
+
+
+class TestParseArgs(unittest.TestCase):
+    def test_provenance_01(self):
+        """Label files have nowhere to put provenance, so it is refused."""
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, parsed, *DIRS, "--provenance")  # noqa: PT027
+
+    def test_provenance_02(self):
+        """JSONL shards and streams keep it."""
+        self.assertTrue(
+            parsed(*DIRS, "--provenance", "--output-format=jsonl").provenance
+        )
+        self.assertTrue(parsed("--stream=-", "--provenance").provenance)
@@ -0,0 +1,73 @@
+import argparse
+import tempfile
+import unittest
+from pathlib import Path
+
+from reconcile.sample_reconciled_traits import json_stems, reservoir_sample
+
+
+class TestReservoirSample(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        root = Path(self.temp.name)
+        self.args = argparse.Namespace(
+            text_dir=root / "text",
+            reconciled_dir=root / "reconciled",
+            openai_dir=root / "openai",
+            traiter_dir=root / "traiter",
+            sample=5,
+            seed=1,
+            strata="none",
+            source_pattern=r"^[^_]+",
+            workers=1,
+        )
+        for dir_ in (
+            self.args.text_dir,
+            self.args.reconciled_dir,
+            self.args.openai_dir,
+            self.args.traiter_dir,
+        ):
+            dir_.mkdir()
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def add(self, stem, *, text=True):
+        if text:
+            (self.args.text_dir / f"{stem}.txt").write_text("text")
+        for dir_ in (
+            self.args.reconciled_dir,
+            self.args.openai_dir,
+            self.args.traiter_dir,
+        ):
+            (dir_ / f"{stem}.json").write_text("{}")
+
+    def test_json_stems_01(self):
+        """Stems are sorted whatever order the directory lists them in."""
+        for stem in ["c", "a", "b"]:
+            self.add(stem)
+        (self.args.reconciled_dir / "notes.txt").write_text("")
+        self.assertEqual(json_stems(self.args.reconciled_dir), ["a", "b", "c"])
+
+    def test_reservoir_sample_01(self):
+        """Labels missing an input are replaced by other labels."""
+        for i in range(10):
+            self.add(f"label_{i}", text=i % 2 == 0)
+        sample = reservoir_sample(self.args)
+        self.assertEqual(
+            sorted(sample), ["label_0", "label_2", "label_4", "label_6", "label_8"]
+        )
+
+    def test_reservoir_sample_02(self):
+        """The sample is short when too few labels have all of their inputs."""
+        for i in range(10):
+            self.add(f"label_{i}", text=i in (0, 1, 2))
+        with self.assertLogs(level="WARNING"):
+            sample = reservoir_sample(self.args)
+        self.assertEqual(sorted(sample), ["label_0", "label_1", "label_2"])
+
+    def test_reservoir_sample_03(self):
+        """The sample is the same for a seed."""
+        for i in range(50):
+            self.add(f"label_{i}")
+        self.assertEqual(reservoir_sample(self.args), reservoir_sample(self.args))
@@ -0,0 +1,17 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from reconcile.pylib.sources import open_source
+
+
+class TestDirSource(unittest.TestCase):
+    def test_dir_source_01(self):
+        """Only files with the suffix are stems."""
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp)
+            for name in ["a.json", "b.json", "c.txt", "notes.md"]:
+                (path / name).write_text("{}")
+            source = open_source(path, ".json")
+            self.assertEqual(source.stems(), {"a", "b"})
+            self.assertEqual(source.read("a"), "{}")
@@ -0,0 +1,46 @@
+import unittest
+
+from reconcile.pylib.spans import locate
+from reconcile.pylib.text_context import TextContext
+
+
+class TestLocate(unittest.TestCase):
+    def test_locate_01(self):
+        """It finds every place a value is, overlaps included."""
+        self.assertEqual(locate("aaaa", {"f": "aaa"}), {"f": [(0, 3), (1, 4)]})
+
+    def test_locate_02(self):
+        """The cases are in a table of text, fields, and expected spans."""
+        cases = [
+            ("Quercus alba near river", {"name": "Quercus alba"}, {"name": [(0, 12)]}),
+            ("Quercus alba", {"name": "Pinus"}, {}),
+            ("Travis Co. | 1972", {"year": 1972}, {"year": [(13, 17)]}),
+            ("oak, pine", {"hab": "oak | pine"}, {"hab": [(0, 3), (5, 9)]}),
+            ("oak  woods", {"hab": "oak \n woods"}, {}),
+            ("an oak", {"a": "an", "b": "oak"}, {"b": [(3, 6)]}),
+            (
+                "oak oak",
+                {"a": "oak", "b": ["oak"]},
+                {"a": [(0, 3), (4, 7)], "b": [(0, 3), (4, 7)]},
+            ),
+            ("Travis", {"loc": {"county": "Travis"}}, {"loc": [(0, 6)]}),
+            ("True", {"flag": True}, {}),
+        ]
+        for text, fields, expect in cases:
+            with self.subTest(text=text, fields=fields):
+                self.assertEqual(locate(text, fields), expect)
+
+    def test_locate_03(self):
+        """It ignores case when asked to."""
+        self.assertEqual(locate("quercus", {"f": "QUERCUS"}), {})
+        self.assertEqual(
+            locate("quercus", {"f": "QUERCUS"}, fold=True), {"f": [(0, 7)]}
+        )
+
+    def test_text_context_01(self):
+        """Offsets are into the text with its whitespace collapsed."""
+        text = TextContext("Quercus\n\n  ALBA near   the river")
+        self.assertEqual(
+            text.locate({"name": "quercus alba", "where": "river"}),
+            {"name": [(0, 12)], "where": [(22, 27)]},
+        )
@@ -0,0 +1,76 @@
+import unittest
+
+from reconcile.pylib.labels.taxon_assoc import TaxonAssociation, split
+from reconcile.pylib.text_context import TextContext
+
+LABEL = TaxonAssociation.label
+
+
+def merge(traiter, openai):
+    traiter = {LABEL: traiter} if traiter else {}
+    result = TaxonAssociation.reconcile(
+        traiter, {"dwc:associatedSpecies": openai}, TextContext()
+    )
+    return result.get(LABEL)
+
+
+class TestTaxonAssociation(unittest.TestCase):
+    def test_taxon_assoc_01(self):
+        """OpenAI associates already in traiter's are dropped."""
+        cases = [
+            ("Quercus alba", "quercus alba", "Quercus alba"),
+            ("Quercus alba", "Quercus", "Quercus alba"),
+            ("Quercus alba", "alba", "Quercus alba"),
+            ("Quercus alba", "Quercus rubra", "Quercus alba | Quercus rubra"),
+            ("Quercus alba | Acer", "Acer, Pinus", "Quercus alba | Acer | Pinus"),
+            ("Quercus alba", "Quercus-alba.", "Quercus alba"),
+        ]
+        for traiter, openai, expect in cases:
+            with self.subTest(traiter=traiter, openai=openai):
+                self.assertEqual(merge(traiter, openai), expect)
+
+    def test_taxon_assoc_02(self):
+        """OpenAI associates are not dropped for being part of each other."""
+        self.assertEqual(merge("", "Acer, Acer saccharum"), "Acer | Acer saccharum")
+        self.assertEqual(merge("", "Acer saccharum, Acer"), "Acer saccharum | Acer")
+
+    def test_taxon_assoc_03(self):
+        """Repeated OpenAI associates are kept once."""
+        self.assertEqual(merge("", "Acer, acer; ACER"), "Acer")
+        self.assertEqual(merge("Pinus", ["Acer", ["acer", 1], "Pinus"]), "Pinus | Acer")
+
+    def test_taxon_assoc_04(self):
+        """Nulls and other non-strings in an OpenAI list are skipped."""
+        self.assertEqual(merge("Quercus alba", ["Pinus", None]), "Quercus alba | Pinus")
+        self.assertEqual(merge("", [None, 3, "", ["Acer"]]), "Acer")
+
+    def test_taxon_assoc_05(self):
+        """Words only match whole words."""
+        self.assertEqual(merge("Acer saccharum", "Ace"), "Acer saccharum | Ace")
+
+    def test_taxon_assoc_06(self):
+        """Associates longer than the word runs are still found."""
+        traiter = "a b c d e f g h i j"
+        self.assertEqual(merge(traiter, "b c d e f g h i"), traiter)
+        self.assertEqual(
+            merge(traiter, "b c d e f g h x"), f"{traiter} | b c d e f g h x"
+        )
+
+    def test_taxon_assoc_07(self):
+        """Nothing from either side is nothing."""
+        self.assertIsNone(merge("", ""))
+
+
+class TestSplit(unittest.TestCase):
+    def test_split_01(self):
+        """Spaces around separators are trimmed, the ends are left alone."""
+        cases = [
+            ("Acer", ["Acer"]),
+            ("Acer , Pinus;Quercus |  Salix", ["Acer", "Pinus", "Quercus", "Salix"]),
+            (" Acer, Pinus ", [" Acer", "Pinus "]),
+            ("Acer,,Pinus", ["Acer", "", "Pinus"]),
+            ("", [""]),
+        ]
+        for text, expect in cases:
+            with self.subTest(text=text):
+                self.assertEqual(split(text), expect)
@@ -0,0 +1,36 @@
+import io
+import json
+import unittest
+
+from reconcile.pylib.writers import StreamWriter
+
+
+class FlushCounter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestStreamWriter(unittest.TestCase):
+    def test_stream_writer_01(self):
+        """It pushes each record out as soon as it is written."""
+        out = FlushCounter()
+        writer = StreamWriter(out)
+        writer.write({"stem": "a", "reconciled": {}, "errors": []})
+        self.assertEqual(out.flushes, 1)
+        writer.write({"stem": "b", "reconciled": {}, "errors": []})
+        self.assertEqual(out.flushes, 2)
+
+    def test_stream_writer_02(self):
+        """It writes one compact JSON record per line."""
+        out = io.StringIO()
+        StreamWriter(out).write({"stem": "a", "reconciled": {"x": 1}, "errors": []})
+        lines = out.getvalue().splitlines()
+        self.assertEqual(
+            [json.loads(ln) for ln in lines],
+            [{"stem": "a", "reconciled": {"x": 1}, "errors": []}],
+        )